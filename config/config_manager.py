@@ -5,32 +5,197 @@ Handles reading and parsing of configuration files with thread-safe implementati
 
 import configparser
 import os
+import re
 import threading
-from typing import Dict, Any, Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Iterator, List, Tuple
+
+
+_UNSET = object()
+
+# Boolean spellings accepted by configparser
+_BOOLEAN_TRUE = frozenset({'1', 'yes', 'true', 'on'})
+_BOOLEAN_FALSE = frozenset({'0', 'no', 'false', 'off'})
+
+
+def _to_bool(value: Optional[str]) -> Optional[bool]:
+    """
+    Convert an INI value to bool using configparser's accepted spellings.
+    
+    Raises:
+        ValueError: If the value is not a recognised boolean
+    """
+    if value is None:
+        return None
+    normalized = value.strip().lower()
+    if normalized in _BOOLEAN_TRUE:
+        return True
+    if normalized in _BOOLEAN_FALSE:
+        return False
+    raise ValueError(f"Not a boolean: {value}")
+
+
+class FastConfigParser:
+    """
+    Minimal single-pass parser for the framework's flat INI format.
+    
+    Supports ``[SECTION]`` headers, ``key = value`` / ``key: value`` pairs and
+    full-line ``#``/``;`` comments. There is no interpolation and no multi-line
+    values, and bare keys without a delimiter are ignored; keys are lower-cased
+    and ``DEFAULT`` values are visible from every section, matching
+    ``configparser`` for the files this framework ships.
+    """
+    
+    _SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$', re.M)
+    # Each match stays on one line: no \n in the key class or around the delimiter
+    _KV_RE = re.compile(r'^([^=:;#\s][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t]*$', re.M)
+    
+    default_section = configparser.DEFAULTSECT
+    
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._sections: Dict[str, Dict[str, str]] = {}
+        self._defaults: Dict[str, str] = {}
+    
+    def read(self, path: str, encoding: Optional[str] = None) -> List[str]:
+        """Parse the file at path, replacing any previously loaded data."""
+        with open(path, 'r', encoding=encoding) as f:
+            self.read_string(f.read())
+        return [path]
+    
+    def read_string(self, text: str) -> None:
+        """Parse INI text in a single pass over its section headers."""
+        sections: Dict[str, Dict[str, str]] = {}
+        headers = list(self._SECTION_RE.finditer(text))
+        for index, header in enumerate(headers):
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+            body = text[header.end():end]
+            values = sections.setdefault(header.group(1).strip(), {})
+            for match in self._KV_RE.finditer(body):
+                values[match.group(1).lower()] = match.group(2)
+        
+        self._defaults = sections.pop(self.default_section, {})
+        self._sections = sections
+    
+    def sections(self) -> List[str]:
+        """Return the list of named sections (excluding DEFAULT)."""
+        return list(self._sections)
+    
+    def has_section(self, section: str) -> bool:
+        """Check whether a named section exists."""
+        return section in self._sections
+    
+    def items(self, section: str) -> List[Tuple[str, str]]:
+        """Return (key, value) pairs for a section, including DEFAULT values."""
+        return list(self._section_values(section).items())
+    
+    def get(self, section: str, option: str, fallback: Any = _UNSET) -> Any:
+        """Get a raw string value."""
+        try:
+            values = self._section_values(section)
+        except configparser.NoSectionError:
+            if fallback is _UNSET:
+                raise
+            return fallback
+        
+        value = values.get(option.lower())
+        if value is None:
+            if fallback is _UNSET:
+                raise configparser.NoOptionError(option, section)
+            return fallback
+        return value
+    
+    def getint(self, section: str, option: str, fallback: Any = _UNSET) -> Any:
+        """Get a value converted to int."""
+        value = self.get(section, option, fallback=None)
+        if value is None:
+            if fallback is _UNSET:
+                raise configparser.NoOptionError(option, section)
+            return fallback
+        return int(value)
+    
+    def getboolean(self, section: str, option: str, fallback: Any = _UNSET) -> Any:
+        """Get a value converted to bool."""
+        value = self.get(section, option, fallback=None)
+        if value is None:
+            if fallback is _UNSET:
+                raise configparser.NoOptionError(option, section)
+            return fallback
+        return _to_bool(value)
+    
+    def _section_values(self, section: str) -> Dict[str, str]:
+        """Return the merged DEFAULT + section mapping."""
+        if section == self.default_section:
+            return self._defaults
+        if section not in self._sections:
+            raise configparser.NoSectionError(section)
+        return {**self._defaults, **self._sections[section]}
+    
+    def __getitem__(self, section: str) -> 'FastSection':
+        """Return a section proxy, mirroring configparser's mapping access."""
+        if section != self.default_section and section not in self._sections:
+            raise KeyError(section)
+        return FastSection(self, section)
+    
+    def __contains__(self, section: str) -> bool:
+        """Check whether a section (including DEFAULT) exists."""
+        return section == self.default_section or section in self._sections
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate section names, DEFAULT first."""
+        yield self.default_section
+        yield from self._sections
+
+
+class FastSection:
+    """Section proxy exposing the get/getint/getboolean accessors used by ConfigManager."""
+    
+    def __init__(self, parser: FastConfigParser, name: str):
+        """Bind the proxy to a parser section."""
+        self._parser = parser
+        self.name = name
+    
+    def get(self, option: str, fallback: Any = None) -> Any:
+        """Get a raw string value."""
+        return self._parser.get(self.name, option, fallback=fallback)
+    
+    def getint(self, option: str, fallback: Any = None) -> Any:
+        """Get a value converted to int."""
+        return self._parser.getint(self.name, option, fallback=fallback)
+    
+    def getboolean(self, option: str, fallback: Any = None) -> Any:
+        """Get a value converted to bool."""
+        return self._parser.getboolean(self.name, option, fallback=fallback)
 
 
 class ConfigManager:
-    """Thread-safe configuration manager for handling application settings."""
+    """
+    Configuration manager for handling application settings.
+    
+    Use the module-level ``config_manager`` (or ``get_config_manager()``) rather
+    than constructing new instances; each instance parses config.ini itself.
+    """
     
-    _instance = None
-    _lock = threading.Lock()
+    # Set CONFIG_PARSER=configparser to fall back to the stdlib parser
+    use_fast_parser = os.environ.get('CONFIG_PARSER', 'fast').lower() != 'configparser'
     
-    def __new__(cls):
-        """Singleton pattern implementation with thread safety."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(ConfigManager, cls).__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    # cached_property names invalidated on every (re)load
+    _CACHED_SECTIONS = (
+        'android_capabilities',
+        'ios_capabilities',
+        'appium_server_config',
+        'timeout_config',
+        'logging_config',
+        'environment_config',
+    )
     
     def __init__(self):
         """Initialize configuration manager."""
-        if not self._initialized:
-            self.config = configparser.ConfigParser()
-            self.config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
-            self._load_config()
-            self._initialized = True
+        self._lock = threading.Lock()
+        self.config = FastConfigParser() if self.use_fast_parser else configparser.ConfigParser()
+        self.config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
+        self._load_config()
     
     def _load_config(self) -> None:
         """Load configuration from config.ini file."""
@@ -41,99 +206,151 @@ class ConfigManager:
             self.config.read(self.config_path)
         except Exception as e:
             raise Exception(f"Failed to load configuration: {str(e)}")
-    
-    def get_android_capabilities(self) -> Dict[str, Any]:
-        """Get Android device capabilities from configuration."""
-        capabilities = {}
-        android_section = self.config['ANDROID']
-        
-        capabilities.update({
-            'platformName': android_section.get('platform_name'),
-            'platformVersion': android_section.get('platform_version'),
-            'deviceName': android_section.get('device_name'),
-            'automationName': android_section.get('automation_name'),
-            'appPackage': android_section.get('app_package'),
-            'appActivity': android_section.get('app_activity'),
-            'noReset': android_section.getboolean('no_reset'),
-            'fullReset': android_section.getboolean('full_reset'),
-            'newCommandTimeout': android_section.getint('new_command_timeout'),
-            'autoGrantPermissions': android_section.getboolean('auto_grant_permissions'),
-            'autoAcceptAlerts': android_section.getboolean('auto_accept_alerts')
-        })
-        
-        return capabilities
-    
-    def get_ios_capabilities(self) -> Dict[str, Any]:
-        """Get iOS device capabilities from configuration."""
-        capabilities = {}
-        ios_section = self.config['IOS']
         
-        capabilities.update({
-            'platformName': ios_section.get('platform_name'),
-            'platformVersion': ios_section.get('platform_version'),
-            'deviceName': ios_section.get('device_name'),
-            'automationName': ios_section.get('automation_name'),
-            'bundleId': ios_section.get('bundle_id'),
-            'noReset': ios_section.getboolean('no_reset'),
-            'fullReset': ios_section.getboolean('full_reset'),
-            'newCommandTimeout': ios_section.getint('new_command_timeout'),
-            'autoAcceptAlerts': ios_section.getboolean('auto_accept_alerts'),
-            'wdaLocalPort': ios_section.getint('wda_local_port')
-        })
+        # Section dictionaries are built lazily on first access; drop stale ones
+        for name in self._CACHED_SECTIONS:
+            self.__dict__.pop(name, None)
         
-        return capabilities
+        # Flat (section, key) -> raw value index for get_config_value
+        default_section = self.config.default_section
+        self._flat = {
+            (section, key): value
+            for section in [default_section, *self.config.sections()]
+            for key, value in self.config.items(section)
+        }
     
-    def get_appium_server_config(self) -> Dict[str, Any]:
-        """Get Appium server configuration."""
-        default_section = self.config['DEFAULT']
+    @cached_property
+    def android_capabilities(self) -> Dict[str, Any]:
+        """Android device capabilities from configuration, cached until reload."""
+        android_section = self.config['ANDROID']
+        g, gi = android_section.get, android_section.getint
         
         return {
-            'host': default_section.get('appium_host'),
-            'port': default_section.getint('appium_port'),
-            'command_timeout': default_section.getint('command_timeout')
+            'platformName': g('platform_name'),
+            'platformVersion': g('platform_version'),
+            'deviceName': g('device_name'),
+            'automationName': g('automation_name'),
+            'appPackage': g('app_package'),
+            'appActivity': g('app_activity'),
+            'noReset': _to_bool(g('no_reset')),
+            'fullReset': _to_bool(g('full_reset')),
+            'newCommandTimeout': gi('new_command_timeout'),
+            'autoGrantPermissions': _to_bool(g('auto_grant_permissions')),
+            'autoAcceptAlerts': _to_bool(g('auto_accept_alerts'))
         }
     
-    def get_timeout_config(self) -> Dict[str, int]:
-        """Get timeout configuration."""
-        default_section = self.config['DEFAULT']
+    @cached_property
+    def ios_capabilities(self) -> Dict[str, Any]:
+        """iOS device capabilities from configuration, cached until reload."""
+        ios_section = self.config['IOS']
+        g, gi = ios_section.get, ios_section.getint
         
         return {
-            'implicit_wait': default_section.getint('implicit_wait'),
-            'explicit_wait': default_section.getint('explicit_wait'),
-            'page_load_timeout': default_section.getint('page_load_timeout')
+            'platformName': g('platform_name'),
+            'platformVersion': g('platform_version'),
+            'deviceName': g('device_name'),
+            'automationName': g('automation_name'),
+            'bundleId': g('bundle_id'),
+            'noReset': _to_bool(g('no_reset')),
+            'fullReset': _to_bool(g('full_reset')),
+            'newCommandTimeout': gi('new_command_timeout'),
+            'autoAcceptAlerts': _to_bool(g('auto_accept_alerts')),
+            'wdaLocalPort': gi('wda_local_port')
         }
     
-    def get_logging_config(self) -> Dict[str, str]:
-        """Get logging configuration."""
-        default_section = self.config['DEFAULT']
+    @cached_property
+    def appium_server_config(self) -> Mapping[str, Any]:
+        """Appium server configuration, cached until reload."""
+        server_section = self.config['SERVER']
+        g, gi = server_section.get, server_section.getint
         
-        return {
-            'log_level': default_section.get('log_level'),
-            'log_file': default_section.get('log_file')
-        }
+        return MappingProxyType({
+            'host': g('appium_host'),
+            'port': gi('appium_port'),
+            'command_timeout': gi('command_timeout'),
+            'direct_connect': _to_bool(g('direct_connect')) or False
+        })
     
-    def get_environment_config(self) -> Dict[str, Any]:
-        """Get environment specific configuration."""
+    @cached_property
+    def timeout_config(self) -> Mapping[str, int]:
+        """Timeout configuration, cached until reload."""
+        gi = self.config['TIMEOUT'].getint
+        
+        return MappingProxyType({
+            'implicit_wait': gi('implicit_wait'),
+            'explicit_wait': gi('explicit_wait'),
+            'page_load_timeout': gi('page_load_timeout')
+        })
+    
+    @cached_property
+    def logging_config(self) -> Mapping[str, str]:
+        """Logging configuration, cached until reload."""
+        g = self.config['LOGGING'].get
+        
+        return MappingProxyType({
+            'log_level': g('log_level'),
+            'log_file': g('log_file')
+        })
+    
+    @cached_property
+    def environment_config(self) -> Mapping[str, Any]:
+        """Environment specific configuration, cached until reload."""
         env_section = self.config['ENVIRONMENT']
+        g, gi = env_section.get, env_section.getint
         
-        return {
-            'test_environment': env_section.get('test_environment'),
-            'base_url': env_section.get('base_url'),
-            'api_timeout': env_section.getint('api_timeout'),
-            'screenshot_on_failure': env_section.getboolean('screenshot_on_failure'),
-            'video_recording': env_section.getboolean('video_recording'),
-            'parallel_execution': env_section.getboolean('parallel_execution'),
-            'max_workers': env_section.getint('max_workers')
-        }
+        return MappingProxyType({
+            'test_environment': g('test_environment'),
+            'base_url': g('base_url'),
+            'api_timeout': gi('api_timeout'),
+            'screenshot_on_failure': _to_bool(g('screenshot_on_failure')),
+            'video_recording': _to_bool(g('video_recording')),
+            'parallel_execution': _to_bool(g('parallel_execution')),
+            'max_workers': gi('max_workers'),
+            'use_execute_driver': _to_bool(g('use_execute_driver')) or False,
+            'use_mobile_gestures': _to_bool(g('use_mobile_gestures')) or False
+        })
     
-    def get_config_value(self, section: str, key: str, fallback: Optional[str] = None) -> str:
-        """Get a specific configuration value."""
-        try:
-            return self.config.get(section, key, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError):
+    def get_android_capabilities(self) -> Dict[str, Any]:
+        """Get Android device capabilities (a copy owned by the caller)."""
+        return self.android_capabilities.copy()
+    
+    def get_ios_capabilities(self) -> Dict[str, Any]:
+        """Get iOS device capabilities (a copy owned by the caller)."""
+        return self.ios_capabilities.copy()
+    
+    def get_appium_server_config(self) -> Mapping[str, Any]:
+        """Get Appium server configuration (shared, read-only)."""
+        return self.appium_server_config
+    
+    def get_timeout_config(self) -> Mapping[str, int]:
+        """Get timeout configuration (shared, read-only)."""
+        return self.timeout_config
+    
+    def get_logging_config(self) -> Mapping[str, str]:
+        """Get logging configuration (shared, read-only)."""
+        return self.logging_config
+    
+    def get_environment_config(self) -> Mapping[str, Any]:
+        """Get environment specific configuration (shared, read-only)."""
+        return self.environment_config
+    
+    def get_config_value(self, section: str, key: str, fallback: Optional[str] = None) -> Optional[str]:
+        """
+        Get a specific configuration value.
+        
+        Returns:
+            Optional[str]: The value, or fallback if the section or key is missing
+            
+        Raises:
+            configparser.NoSectionError: If the section does not exist and no fallback is given
+        """
+        value = self._flat.get((section, key.lower()))
+        if value is None:
             if fallback is not None:
                 return fallback
-            raise
+            if section != self.config.default_section and not self.config.has_section(section):
+                raise configparser.NoSectionError(section)
+        return value
     
     def reload_config(self) -> None:
         """Reload configuration from file."""
@@ -142,4 +359,9 @@ class ConfigManager:
 
 
 # Global configuration instance
-config_manager = ConfigManager()
\ No newline at end of file
+config_manager = ConfigManager()
+
+
+def get_config_manager() -> ConfigManager:
+    """Get the shared ConfigManager instance."""
+    return config_manager
@@ -1,18 +1,23 @@
 """
 Device Configuration
 Centralized device and app configuration
+
+The mappings below are read-only views; copy them with dict(...) before
+building per-test variations.
 """
 
+from types import MappingProxyType
+
 # Device Configuration
-DEVICE_CONFIG = {
+DEVICE_CONFIG = MappingProxyType({
     "platform_name": "Android",
     "device_name": "Android",
     "automation_name": "uiautomator2",
     "appium_server_url": "http://127.0.0.1:4723"
-}
+})
 
 # App Configuration
-APP_CONFIG = {
+APP_CONFIG = MappingProxyType({
     "package_name": "com.scopex.scopexmobile",
     "activity_name": ".MainActivity",
     "app_path": None,  # Set if using APK file
@@ -21,19 +26,20 @@ APP_CONFIG = {
     "native_web_screenshot": True,
     "new_command_timeout": 3600,
     "connect_hardware_keyboard": True
-}
+})
 
 # Wait Configuration
-WAIT_CONFIG = {
-    "implicit_wait": 10,
+WAIT_CONFIG = MappingProxyType({
+    "implicit_wait": 0,  # explicit waits only; keeps absence checks instant
     "explicit_wait": 30,
+    "text_extraction_timeout": 30,
     "page_load_timeout": 30,
     "script_timeout": 30
-}
+})
 
 # Test Configuration
-TEST_CONFIG = {
+TEST_CONFIG = MappingProxyType({
     "screenshot_on_failure": True,
     "video_recording": False,
     "log_level": "INFO"
-}
+})
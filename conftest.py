@@ -5,17 +5,16 @@ Provides driver management, parameterization, and test setup/teardown functional
 
 import os
 import pytest
-from typing import Generator, Dict, Any
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
-from appium.options.ios import XCUITestOptions
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Generator, Dict, Any, NamedTuple
 
 from config.config_manager import config_manager
 from utils.logger import get_logger, create_test_logger
-from utils.appium_server import AppiumServerManager
 from utils.soft_assertions import create_soft_assertions
-from utils.data_manager import DataManager, get_data_manager
-from utils.data_validator import DataValidator, SchemaManager
+
+# The Appium client, server manager and data helpers are imported inside the
+# hooks and fixtures that use them so collection does not pay for them.
 
 
 # Global logger
@@ -58,6 +57,21 @@ def pytest_addoption(parser):
         default=False,
         help="Keep Appium server running after tests"
     )
+    
+    parser.addoption(
+        "--shared-driver",
+        action="store_true",
+        default=False,
+        help="Reuse one driver session for all tests, restarting the app between tests"
+    )
+    
+    parser.addoption(
+        "--gesture-duration-ms",
+        action="store",
+        type=int,
+        default=400,
+        help="Base duration in milliseconds for swipe and long-press gestures"
+    )
 
 
 def pytest_configure(config):
@@ -78,6 +92,13 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one xdist worker with --dist loadgroup"
+    )
+    
+    # Resolve platform filtering once instead of per test item
+    config._platform = config.getoption("--platform").lower()
+    config._skip_markers = {"android", "ios"} - {config._platform}
     
     # Create necessary directories
     os.makedirs("logs", exist_ok=True)
@@ -88,6 +109,8 @@ def pytest_configure(config):
 def pytest_sessionstart(session):
     """Session start hook - start Appium server if requested."""
     if session.config.getoption("--start-server"):
+        from utils.appium_server import AppiumServerManager
+        
         logger.info("Starting Appium server...")
         if AppiumServerManager.start_server():
             logger.info("Appium server started successfully")
@@ -99,20 +122,41 @@ def pytest_sessionstart(session):
 def pytest_sessionfinish(session, exitstatus):
     """Session finish hook - stop Appium server if not keeping it."""
     if session.config.getoption("--start-server") and not session.config.getoption("--keep-server"):
+        from utils.appium_server import AppiumServerManager
+        
         logger.info("Stopping Appium server...")
         AppiumServerManager.stop_server()
 
 
-def pytest_runtest_setup(item):
-    """Setup hook for each test - platform filtering."""
-    platform = item.config.getoption("--platform").lower()
+def pytest_collection_modifyitems(config, items):
+    """Mark tests for the other platform as skipped before any fixture is set up."""
+    skip = config._skip_markers
     
-    # Skip tests based on platform markers
-    if item.get_closest_marker("android") and platform != "android":
-        pytest.skip("Test marked for Android platform only")
-    
-    if item.get_closest_marker("ios") and platform != "ios":
-        pytest.skip("Test marked for iOS platform only")
+    for item in items:
+        for marker in item.iter_markers():
+            if marker.name in skip:
+                item.add_marker(pytest.mark.skip(reason=f"Test marked for {marker.name} platform only"))
+                break
+
+
+# Fixture name -> users.json section expanded into one test per user
+_USER_PARAMS = {
+    "valid_user": "valid_users",
+    "invalid_user": "invalid_users",
+}
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize per-user tests so xdist can spread users across workers."""
+    for fixture_name, user_type in _USER_PARAMS.items():
+        if fixture_name in metafunc.fixturenames:
+            from utils.data_manager import get_data_manager
+            
+            users = get_data_manager().get_user_data(user_type)
+            metafunc.parametrize(
+                fixture_name, users,
+                ids=[user.get("id") or user.get("username") for user in users]
+            )
 
 
 @pytest.fixture(scope="session")
@@ -131,6 +175,8 @@ def test_config(request):
 @pytest.fixture(scope="session")
 def appium_server():
     """Manage Appium server for the test session."""
+    from utils.appium_server import AppiumServerManager
+    
     server_manager = AppiumServerManager.get_instance()
     
     if not server_manager.is_server_running():
@@ -138,26 +184,98 @@ def appium_server():
         if not server_manager.start_server():
             pytest.fail("Failed to start Appium server")
     
+    # Later health checks this session reuse this result instead of polling
+    server_manager.mark_session_confirmed()
+    
     yield server_manager
     
     # Server cleanup is handled by session hooks
 
 
-@pytest.fixture(scope="function")
-def driver(request, test_config, appium_server):
-    """Provide Appium WebDriver instance for tests."""
+def _platform_options(platform: str):
+    """
+    Build a fresh Appium options object for a platform
+    
+    Options instances are mutable, so one is built per driver.
+    """
+    if platform == "ios":
+        from appium.options.ios import XCUITestOptions
+        return XCUITestOptions()
+    
+    from appium.options.android import UiAutomator2Options
+    return UiAutomator2Options()
+
+
+def _worker_server_url(server_config) -> str:
+    """
+    Resolve the Appium server URL for this process
+    
+    Under pytest-xdist, APPIUM_URLS (comma separated) maps each worker to its
+    own server/device, round-robin by worker number.
+    """
+    urls = [url.strip() for url in os.environ.get("APPIUM_URLS", "").split(",") if url.strip()]
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if urls and worker.startswith("gw"):
+        return urls[int(worker[2:]) % len(urls)]
+    if urls:
+        return urls[0]
+    return f"http://{server_config['host']}:{server_config['port']}/wd/hub"
+
+
+# UiAutomator2 page source attributes no page object or utility reads; leaving
+# them out shrinks every page_source payload. Pages still rely on class, text,
+# resource-id, content-desc, displayed and enabled.
+PAGE_SOURCE_EXCLUDED_ATTRIBUTES = (
+    "checkable,checked,clickable,focusable,focused,long-clickable,"
+    "password,scrollable,selected,bounds"
+)
+
+
+@pytest.fixture(scope="session")
+def _driver_prototype():
+    """
+    Build the immutable parts of driver creation once per session
+    
+    Returns:
+        Dict: platform -> (capabilities template, server URL, implicit wait, direct connect flag)
+    """
+    server_config = config_manager.get_appium_server_config()
+    server_url = _worker_server_url(server_config)
+    implicit_wait = config_manager.get_timeout_config()['implicit_wait']
+    direct_connect = server_config['direct_connect']
+    
+    # Applied as a session setting through the capability, so no extra request per driver
+    android_capabilities = {
+        'settings[pageSourceExcludedAttributes]': PAGE_SOURCE_EXCLUDED_ATTRIBUTES,
+        **config_manager.get_android_capabilities(),
+    }
+    
+    # Templates are read-only; fixtures copy them before applying overrides
+    return {
+        "android": (MappingProxyType(android_capabilities), server_url, implicit_wait, direct_connect),
+        "ios": (MappingProxyType(config_manager.get_ios_capabilities()), server_url, implicit_wait, direct_connect),
+    }
+
+
+def _create_driver(test_config, driver_prototype):
+    """
+    Create an Appium driver for the configured platform
+    
+    Args:
+        test_config: Test configuration fixture value
+        driver_prototype: Per-platform driver templates
+        
+    Returns:
+        Tuple: (driver instance, capabilities used)
+    """
     platform = test_config['platform']
     
-    # Get capabilities based on platform
-    if platform == "android":
-        capabilities = config_manager.get_android_capabilities()
-        options = UiAutomator2Options()
-    elif platform == "ios":
-        capabilities = config_manager.get_ios_capabilities()
-        options = XCUITestOptions()
-    else:
+    if platform not in driver_prototype:
         pytest.fail(f"Unsupported platform: {platform}")
     
+    capabilities_template, server_url, implicit_wait, direct_connect = driver_prototype[platform]
+    capabilities = dict(capabilities_template)
+    
     # Override with command line options if provided
     if test_config['device_name']:
         capabilities['deviceName'] = test_config['device_name']
@@ -166,21 +284,18 @@ def driver(request, test_config, appium_server):
         capabilities['app'] = test_config['app_path']
     
     # Load capabilities into options
-    options.load_capabilities(capabilities)
+    options = _platform_options(platform).load_capabilities(capabilities)
     
-    # Get server configuration
-    server_config = config_manager.get_appium_server_config()
-    server_url = f"http://{server_config['host']}:{server_config['port']}/wd/hub"
+    from appium import webdriver
     
     # Create driver
     driver_instance = None
     try:
         logger.info(f"Creating {platform} driver with capabilities: {capabilities}")
-        driver_instance = webdriver.Remote(server_url, options=options)
+        driver_instance = webdriver.Remote(server_url, options=options, direct_connection=direct_connect)
         
         # Set timeouts
-        timeout_config = config_manager.get_timeout_config()
-        driver_instance.implicitly_wait(timeout_config['implicit_wait'])
+        driver_instance.implicitly_wait(implicit_wait)
         
         logger.info(f"Driver created successfully for {platform}")
         
@@ -188,13 +303,94 @@ def driver(request, test_config, appium_server):
         logger.error(f"Failed to create driver: {str(e)}")
         pytest.fail(f"Failed to create driver: {str(e)}")
     
+    return driver_instance, capabilities
+
+
+def _quit_driver(driver_instance):
+    """Quit a driver, logging instead of raising on errors."""
+    from tests.utils.wait_utils import release_driver
+    
+    release_driver(driver_instance)
+    try:
+        driver_instance.quit()
+        logger.info("Driver quit successfully")
+    except Exception as e:
+        logger.warning(f"Error quitting driver: {str(e)}")
+
+
+def _restart_app(driver_instance, capabilities):
+    """Terminate and relaunch the app under test so the next test starts clean."""
+    app_id = capabilities.get('appPackage') or capabilities.get('bundleId')
+    if not app_id:
+        return
+    
+    from tests.utils.wait_utils import reset_app_ready
+    
+    reset_app_ready(driver_instance)
+    try:
+        driver_instance.terminate_app(app_id)
+        driver_instance.activate_app(app_id)
+    except Exception as e:
+        logger.warning(f"Failed to restart app {app_id}: {str(e)}")
+
+
+@pytest.fixture(scope="session")
+def driver_session(test_config, appium_server, _driver_prototype):
+    """
+    Provide one Appium driver for the whole session (used with --shared-driver)
+    
+    Returns:
+        Tuple: (driver instance, capabilities used)
+    """
+    driver_instance, capabilities = _create_driver(test_config, _driver_prototype)
+    
+    yield driver_instance, capabilities
+    
+    if driver_instance:
+        _quit_driver(driver_instance)
+
+
+@pytest.fixture(scope="class")
+def driver_class(request, test_config, appium_server, _driver_prototype):
+    """
+    Provide one Appium driver per test class (the session driver with --shared-driver)
+    
+    Returns:
+        Tuple: (driver instance, capabilities used)
+    """
+    if request.config.getoption("--shared-driver"):
+        yield request.getfixturevalue("driver_session")
+        return
+    
+    driver_instance, capabilities = _create_driver(test_config, _driver_prototype)
+    
+    yield driver_instance, capabilities
+    
+    if driver_instance:
+        _quit_driver(driver_instance)
+
+
+@pytest.fixture(scope="function")
+def driver(request, test_config, driver_class):
+    """
+    Provide Appium WebDriver instance for tests.
+    
+    Tests in a class share one Appium session; the app is restarted
+    after each test so the next one starts clean.
+    """
+    platform = test_config['platform']
+    driver_instance, capabilities = driver_class
+    
     yield driver_instance
     
     # Cleanup
     if driver_instance:
         try:
-            # Take screenshot on failure
-            if request.node.rep_call.failed:
+            # Take screenshot on failure; soft assertion failures only surface
+            # in teardown, so check the test's collector as well
+            soft_assertions = request.node.funcargs.get('soft_assert')
+            soft_failed = soft_assertions is not None and soft_assertions.has_failures()
+            if request.node.rep_call.failed or soft_failed:
                 screenshot_name = f"failure_{request.node.name}_{platform}.png"
                 screenshot_path = f"screenshots/{screenshot_name}"
                 driver_instance.save_screenshot(screenshot_path)
@@ -202,18 +398,88 @@ def driver(request, test_config, appium_server):
         except Exception as e:
             logger.warning(f"Failed to take failure screenshot: {str(e)}")
         
-        try:
-            driver_instance.quit()
-            logger.info("Driver quit successfully")
-        except Exception as e:
-            logger.warning(f"Error quitting driver: {str(e)}")
+        _restart_app(driver_instance, capabilities)
+
+
+@pytest.fixture(scope="class")
+def _class_pages(driver_class):
+    """Page objects shared by the tests of a class, keyed by page class."""
+    return {}
+
+
+def _shared_page(page_class, pages, driver_instance):
+    """Return the class-shared instance of a page object, creating it on first use."""
+    page = pages.get(page_class)
+    if page is None:
+        page = pages[page_class] = page_class(driver_instance)
+    return page
+
+
+@pytest.fixture(scope="function")
+def base_page(_class_pages, driver):
+    """
+    Provide a BasePage shared by the tests of a class
+    
+    Args:
+        _class_pages: Class-scoped page object cache
+        driver: Appium driver fixture
+        
+    Returns:
+        BasePage: Page object; its cached screen state is reset after each test
+    """
+    from pages.base_page import BasePage
+    
+    page = _shared_page(BasePage, _class_pages, driver)
+    yield page
+    page.reset_state()
+
+
+@pytest.fixture(scope="class")
+def all_texts(driver_class):
+    """
+    Provide the on-screen TextView texts, extracted once per test class
+    
+    Args:
+        driver_class: Class-scoped driver fixture
+        
+    Returns:
+        List[str]: Non-empty texts of the screen shown at launch
+    """
+    from tests.utils.text_utils import get_text_elements
+    
+    driver_instance, _ = driver_class
+    return get_text_elements(driver_instance)
+
+
+@pytest.fixture(scope="function")
+def login_page(_class_pages, driver):
+    """
+    Provide a LoginPage shared by the tests of a class
+    
+    Args:
+        _class_pages: Class-scoped page object cache
+        driver: Appium driver fixture
+        
+    Returns:
+        LoginPage: Page object; its cached screen state is reset after each test
+    """
+    from pages.login_page import LoginPage
+    
+    page = _shared_page(LoginPage, _class_pages, driver)
+    yield page
+    page.reset_state()
 
 
 @pytest.fixture(scope="function")
 def test_logger(request):
     """Provide test-specific logger."""
     test_name = request.node.name
-    return create_test_logger(test_name)
+    test_logger = create_test_logger(test_name)
+    
+    yield test_logger
+    
+    # Step records are buffered; write them out once per test
+    test_logger.flush()
 
 
 @pytest.fixture(scope="function")
@@ -234,32 +500,22 @@ def soft_assert(request):
 
 
 @pytest.fixture(params=["android", "ios"])
-def cross_platform_driver(request, appium_server):
+def cross_platform_driver(request, appium_server, _driver_prototype):
     """Provide driver for cross-platform testing."""
     platform = request.param
     
-    # Get capabilities based on platform
-    if platform == "android":
-        capabilities = config_manager.get_android_capabilities()
-        options = UiAutomator2Options()
-    else:  # ios
-        capabilities = config_manager.get_ios_capabilities()
-        options = XCUITestOptions()
+    capabilities, server_url, implicit_wait, direct_connect = _driver_prototype[platform]
+    options = _platform_options(platform).load_capabilities(capabilities)
     
-    options.load_capabilities(capabilities)
-    
-    # Get server configuration
-    server_config = config_manager.get_appium_server_config()
-    server_url = f"http://{server_config['host']}:{server_config['port']}/wd/hub"
+    from appium import webdriver
     
     # Create driver
     driver_instance = None
     try:
-        driver_instance = webdriver.Remote(server_url, options=options)
+        driver_instance = webdriver.Remote(server_url, options=options, direct_connection=direct_connect)
         
         # Set timeouts
-        timeout_config = config_manager.get_timeout_config()
-        driver_instance.implicitly_wait(timeout_config['implicit_wait'])
+        driver_instance.implicitly_wait(implicit_wait)
         
     except Exception as e:
         pytest.skip(f"Failed to create {platform} driver: {str(e)}")
@@ -268,10 +524,103 @@ def cross_platform_driver(request, appium_server):
     
     # Cleanup
     if driver_instance:
-        try:
-            driver_instance.quit()
-        except Exception as e:
-            logger.warning(f"Error quitting {platform} driver: {str(e)}")
+        _quit_driver(driver_instance)
+
+
+@pytest.fixture(scope="session")
+def _window_sizes():
+    """Session-wide cache of device window sizes, keyed by device identity."""
+    return {}
+
+
+@pytest.fixture(scope="function")
+def window_size(driver, _window_sizes):
+    """
+    Provide the device window size, fetched from Appium once per device
+    
+    Args:
+        driver: Appium driver fixture
+        _window_sizes: Session window size cache
+        
+    Returns:
+        Tuple[int, int]: (width, height)
+    """
+    caps = driver.capabilities
+    key = (caps.get('platformName'), caps.get('udid') or caps.get('deviceName'))
+    if key not in _window_sizes:
+        size = driver.get_window_size()
+        _window_sizes[key] = (size['width'], size['height'])
+    return _window_sizes[key]
+
+
+class ScreenAnchors(NamedTuple):
+    """Common gesture coordinates for one screen size, in integer pixels."""
+    cx: int
+    cy: int
+    left: int
+    right: int
+    top: int
+    bottom: int
+    mid_upper: int
+    mid_lower: int
+
+
+@lru_cache(maxsize=None)
+def _screen_anchors(width: int, height: int) -> ScreenAnchors:
+    """Compute the anchors for a screen size once, using integer arithmetic."""
+    return ScreenAnchors(
+        cx=width // 2,
+        cy=height // 2,
+        left=width // 10,
+        right=9 * width // 10,
+        top=height // 10,
+        bottom=9 * height // 10,
+        mid_upper=2 * height // 10,
+        mid_lower=8 * height // 10,
+    )
+
+
+@pytest.fixture(scope="function")
+def screen_anchors(window_size):
+    """
+    Provide precomputed gesture coordinates for the device screen
+    
+    Args:
+        window_size: Cached (width, height) fixture
+        
+    Returns:
+        ScreenAnchors: Centre, edge and mid-band coordinates
+    """
+    return _screen_anchors(*window_size)
+
+
+@pytest.fixture(scope="session")
+def gesture_duration_ms(request):
+    """
+    Provide the base gesture duration given on the command line
+    
+    Args:
+        request: pytest request object
+        
+    Returns:
+        int: Value of --gesture-duration-ms
+    """
+    return request.config.getoption("--gesture-duration-ms")
+
+
+@pytest.fixture(scope="function")
+def restart_app(driver_class):
+    """
+    Provide a callable that restarts the app under test mid-test
+    
+    Args:
+        driver_class: Class-scoped driver fixture
+        
+    Returns:
+        Callable[[], None]: Terminates and relaunches the app on the test's driver
+    """
+    driver_instance, capabilities = driver_class
+    return lambda: _restart_app(driver_instance, capabilities)
 
 
 @pytest.fixture(scope="function")
@@ -292,12 +641,16 @@ def page_factory(driver):
     return PageFactory(driver)
 
 
+# Item attribute per test phase, e.g. item.rep_call
+_REP_NAMES = {'setup': 'rep_setup', 'call': 'rep_call', 'teardown': 'rep_teardown'}
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture test results for failure handling."""
     outcome = yield
     rep = outcome.get_result()
-    setattr(item, "rep_" + rep.when, rep)
+    setattr(item, _REP_NAMES[rep.when], rep)
 
 
 @pytest.fixture(scope="session")
@@ -308,6 +661,8 @@ def data_manager():
     Returns:
         DataManager: Configured data manager instance
     """
+    from utils.data_manager import get_data_manager
+    
     return get_data_manager()
 
 
@@ -319,6 +674,8 @@ def data_validator():
     Returns:
         DataValidator: Data validator instance
     """
+    from utils.data_validator import DataValidator
+    
     return DataValidator()
 
 
@@ -330,35 +687,65 @@ def schema_manager():
     Returns:
         SchemaManager: Schema manager instance
     """
+    from utils.data_validator import SchemaManager
+    
     return SchemaManager()
 
 
-@pytest.fixture
-def test_users(data_manager):
+@pytest.fixture(scope="session")
+def _app_data(data_manager):
     """
-    Provide test user data
+    Provide parsed app_data.yaml, loaded once per session
+    
+    Args:
+        data_manager: DataManager fixture
+        
+    Returns:
+        Dict: Parsed application data
+    """
+    return data_manager.load_data("app_data.yaml")
+
+
+@pytest.fixture(scope="session")
+def _users_data(data_manager):
+    """
+    Provide parsed users.json, loaded once per session
     
     Args:
         data_manager: DataManager fixture
         
+    Returns:
+        Dict: Parsed user data
+    """
+    return data_manager.load_data("users.json")
+
+
+@pytest.fixture(scope="session")
+def test_users(_users_data):
+    """
+    Provide test user data
+    
+    Args:
+        _users_data: Session-cached users.json fixture
+        
     Returns:
         List[Dict]: List of valid test users
     """
-    return data_manager.get_user_data("valid_users")
+    return _users_data.get("valid_users", [])
 
 
-@pytest.fixture
-def invalid_users(data_manager):
+@pytest.fixture(scope="session")
+def invalid_users(_users_data):
     """
     Provide invalid test user data
     
     Args:
-        data_manager: DataManager fixture
+        _users_data: Session-cached users.json fixture
         
     Returns:
         List[Dict]: List of invalid test users
     """
-    return data_manager.get_user_data("invalid_users")
+    return _users_data.get("invalid_users", [])
 
 
 @pytest.fixture
@@ -404,61 +791,83 @@ def premium_user(data_manager):
     return data_manager.get_user_by_id("user_003", "valid_users") or {}
 
 
+@pytest.fixture(scope="session")
+def cli_platform(request):
+    """
+    Provide the platform given on the command line
+    
+    Args:
+        request: pytest request object
+        
+    Returns:
+        Optional[str]: Value of --platform, if any
+    """
+    return getattr(request.config.option, 'platform', None)
+
+
+@pytest.fixture
+def effective_platform(request, cli_platform):
+    """
+    Provide the platform for the current test, letting markers override the CLI
+    
+    Args:
+        request: pytest request object
+        cli_platform: Command line platform fixture
+        
+    Returns:
+        Optional[str]: 'Android' or 'iOS' when the test is marked, else cli_platform
+    """
+    for marker in request.node.iter_markers():
+        if marker.name == 'android':
+            return 'Android'
+        if marker.name == 'ios':
+            return 'iOS'
+    return cli_platform
+
+
 @pytest.fixture
-def device_configs(data_manager, request):
+def device_configs(data_manager, effective_platform):
     """
     Provide device configuration data with optional filtering
     
     Args:
         data_manager: DataManager fixture
-        request: pytest request object
+        effective_platform: Resolved platform fixture
         
     Returns:
         List[Dict]: List of device configurations
     """
-    # Get platform from command line or test marker
-    platform = getattr(request.config.option, 'platform', None)
-    
-    # Check for platform marker on test
-    if hasattr(request, 'node'):
-        for marker in request.node.iter_markers():
-            if marker.name in ['android', 'ios']:
-                platform = 'Android' if marker.name == 'android' else 'iOS'
-                break
-    
-    return data_manager.get_device_data(platform=platform)
+    return data_manager.get_device_data(platform=effective_platform)
 
 
 @pytest.fixture
-def high_priority_devices(data_manager, request):
+def high_priority_devices(data_manager, cli_platform):
     """
     Provide high priority device configurations
     
     Args:
         data_manager: DataManager fixture
-        request: pytest request object
+        cli_platform: Command line platform fixture (markers do not override it here)
         
     Returns:
         List[Dict]: List of high priority device configurations
     """
-    platform = getattr(request.config.option, 'platform', None)
-    return data_manager.get_device_data(platform=platform, priority="high")
+    return data_manager.get_device_data(platform=cli_platform, priority="high")
 
 
 @pytest.fixture
-def app_config(data_manager, request):
+def app_config(data_manager, cli_platform):
     """
     Provide application configuration data
     
     Args:
         data_manager: DataManager fixture
-        request: pytest request object
+        cli_platform: Command line platform fixture (markers do not override it here)
         
     Returns:
         Dict: Application configuration
     """
-    platform = getattr(request.config.option, 'platform', None)
-    return data_manager.get_app_config(platform)
+    return data_manager.get_app_config(cli_platform)
 
 
 @pytest.fixture
@@ -551,19 +960,18 @@ def parametrized_devices(request, data_manager):
     return data_manager.get_device_data(priority=priority)
 
 
-@pytest.fixture
-def login_scenarios(data_manager):
+@pytest.fixture(scope="session")
+def login_scenarios(_users_data):
     """
     Provide login test scenarios
     
     Args:
-        data_manager: DataManager fixture
+        _users_data: Session-cached users.json fixture
         
     Returns:
         List[Dict]: Login test scenarios
     """
-    users_data = data_manager.load_data("users.json")
-    return users_data.get("test_scenarios", {}).get("login_validation", [])
+    return _users_data.get("test_scenarios", {}).get("login_validation", [])
 
 
 @pytest.fixture
@@ -595,78 +1003,73 @@ def registration_scenario(data_manager):
 
 
 @pytest.fixture
-def test_products(data_manager):
+def test_products(_app_data):
     """
     Provide test product data
     
     Args:
-        data_manager: DataManager fixture
+        _app_data: Session-cached app_data.yaml fixture
         
     Returns:
         List[Dict]: Test product data
     """
-    app_data = data_manager.load_data("app_data.yaml")
-    return app_data.get("test_data", {}).get("products", [])
+    return _app_data.get("test_data", {}).get("products", [])
 
 
 @pytest.fixture
-def search_terms(data_manager):
+def search_terms(_app_data):
     """
     Provide search term test data
     
     Args:
-        data_manager: DataManager fixture
+        _app_data: Session-cached app_data.yaml fixture
         
     Returns:
         Dict: Search terms by category (valid, invalid, special_characters)
     """
-    app_data = data_manager.load_data("app_data.yaml")
-    return app_data.get("test_data", {}).get("search_terms", {})
+    return _app_data.get("test_data", {}).get("search_terms", {})
 
 
 @pytest.fixture
-def form_data(data_manager):
+def form_data(_app_data):
     """
     Provide form test data
     
     Args:
-        data_manager: DataManager fixture
+        _app_data: Session-cached app_data.yaml fixture
         
     Returns:
         Dict: Form data (valid and invalid)
     """
-    app_data = data_manager.load_data("app_data.yaml")
-    return app_data.get("test_data", {}).get("form_data", {})
+    return _app_data.get("test_data", {}).get("form_data", {})
 
 
 @pytest.fixture
-def ui_timeouts(data_manager):
+def ui_timeouts(_app_data):
     """
     Provide UI timeout configurations
     
     Args:
-        data_manager: DataManager fixture
+        _app_data: Session-cached app_data.yaml fixture
         
     Returns:
         Dict: Timeout values for different operations
     """
-    app_data = data_manager.load_data("app_data.yaml")
-    return app_data.get("test_data", {}).get("ui_elements", {}).get("timeouts", {})
+    return _app_data.get("test_data", {}).get("ui_elements", {}).get("timeouts", {})
 
 
 @pytest.fixture
-def gesture_settings(data_manager):
+def gesture_settings(_app_data):
     """
     Provide gesture configuration data
     
     Args:
-        data_manager: DataManager fixture
+        _app_data: Session-cached app_data.yaml fixture
         
     Returns:
         Dict: Gesture settings (durations, scale factors)
     """
-    app_data = data_manager.load_data("app_data.yaml")
-    return app_data.get("test_data", {}).get("ui_elements", {}).get("gestures", {})
+    return _app_data.get("test_data", {}).get("ui_elements", {}).get("gestures", {})
 
 
 @pytest.fixture
@@ -721,10 +1124,13 @@ def validated_device_config(device_configs, data_validator):
 
 
 # Parametrized fixtures for cross-platform testing
-@pytest.fixture(params=[
+_PLATFORM_VERSIONS = (
     {"platform": "iOS", "version": "16.0"},
-    {"platform": "Android", "version": "13"}
-])
+    {"platform": "Android", "version": "13"},
+)
+
+
+@pytest.fixture(params=_PLATFORM_VERSIONS)
 def platform_config(request, data_manager):
     """
     Parametrized fixture for cross-platform testing
@@ -793,42 +1199,61 @@ def data_driven_device_tests(device_configs):
     return device_configs
 
 
-# Utility fixtures for common test data
-@pytest.fixture
+# Utility fixtures for common test data; read-only since it is shared by the session
+_TEST_DATA = MappingProxyType({
+    'valid_credentials': MappingProxyType({
+        'username': 'testuser@example.com',
+        'password': 'TestPassword123'
+    }),
+    'invalid_credentials': MappingProxyType({
+        'username': 'invalid@example.com',
+        'password': 'wrongpassword'
+    }),
+    'test_text': 'Hello, Mobile Automation!',
+    'timeout': 10
+})
+
+
+@pytest.fixture(scope="session")
 def test_data():
     """Provide common test data."""
-    return {
-        'valid_credentials': {
-            'username': 'testuser@example.com',
-            'password': 'TestPassword123'
-        },
-        'invalid_credentials': {
-            'username': 'invalid@example.com',
-            'password': 'wrongpassword'
-        },
-        'test_text': 'Hello, Mobile Automation!',
-        'timeout': 10
-    }
+    return _TEST_DATA
+
+
+@pytest.fixture(scope="session")
+def valid_credentials(test_data):
+    """Provide the valid login credentials from test_data."""
+    return test_data['valid_credentials']
+
+
+@pytest.fixture(scope="session")
+def invalid_credentials(test_data):
+    """Provide the invalid login credentials from test_data."""
+    return test_data['invalid_credentials']
 
 
 # Parametrized fixtures for different test scenarios
-@pytest.fixture(params=[
+_PLATFORM_ORIENTATIONS = (
     {'platform': 'android', 'orientation': 'portrait'},
     {'platform': 'android', 'orientation': 'landscape'},
     {'platform': 'ios', 'orientation': 'portrait'},
-    {'platform': 'ios', 'orientation': 'landscape'}
-])
+    {'platform': 'ios', 'orientation': 'landscape'},
+)
+
+_SCREEN_SIZES = {
+    'small': {'width': 320, 'height': 568},   # iPhone SE
+    'medium': {'width': 375, 'height': 667},  # iPhone 8
+    'large': {'width': 414, 'height': 896}    # iPhone 11
+}
+
+
+@pytest.fixture(params=_PLATFORM_ORIENTATIONS)
 def platform_orientation(request):
     """Provide platform and orientation combinations."""
     return request.param
 
 
-@pytest.fixture(params=['small', 'medium', 'large'])
+@pytest.fixture(params=list(_SCREEN_SIZES))
 def screen_size(request):
     """Provide different screen size categories for responsive testing."""
-    sizes = {
-        'small': {'width': 320, 'height': 568},   # iPhone SE
-        'medium': {'width': 375, 'height': 667},  # iPhone 8
-        'large': {'width': 414, 'height': 896}    # iPhone 11
-    }
-    return sizes[request.param]
\ No newline at end of file
+    return _SCREEN_SIZES[request.param]
\ No newline at end of file
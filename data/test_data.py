@@ -1,10 +1,26 @@
 """
 Test Data
 Centralized test data for mobile app testing
+
+All data is frozen at import: dicts become MappingProxyType and lists
+become tuples, so it can be shared safely between tests and workers.
 """
 
+from types import MappingProxyType
+from typing import Any
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 # Scopex Mobile App Test Data
-SCOPEX_TEST_DATA = {
+SCOPEX_TEST_DATA = _freeze({
     "app_name": "Scopex Mobile",
     "expected_texts": [
         "That's more money reaching your loved ones",
@@ -29,10 +45,10 @@ SCOPEX_TEST_DATA = {
             ]
         }
     }
-}
+})
 
 # General Mobile App Test Data
-GENERAL_TEST_DATA = {
+GENERAL_TEST_DATA = _freeze({
     "common_elements": {
         "text_views": "android.widget.TextView",
         "buttons": "android.widget.Button",
@@ -45,23 +61,26 @@ GENERAL_TEST_DATA = {
         "max_wait_time": 30,
         "text_extraction_timeout": 10
     }
-}
+})
 
 # Test Environment Data
-ENVIRONMENT_DATA = {
+ENVIRONMENT_DATA = _freeze({
     "development": {
         "appium_server": "http://127.0.0.1:4723",
         "device_name": "Android Emulator",
-        "log_level": "DEBUG"
+        "log_level": "DEBUG",
+        "direct_connect": False
     },
     "staging": {
         "appium_server": "http://staging-appium:4723",
         "device_name": "Android Device",
-        "log_level": "INFO"
+        "log_level": "INFO",
+        "direct_connect": True
     },
     "production": {
         "appium_server": "http://prod-appium:4723",
         "device_name": "Production Device",
-        "log_level": "WARNING"
+        "log_level": "WARNING",
+        "direct_connect": True
     }
-}
+})
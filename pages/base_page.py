@@ -3,43 +3,115 @@ Base Page Class for Mobile Automation Framework
 Implements Page Factory pattern with common functionality for mobile elements.
 """
 
+import itertools
+import json
+import os
+import re
 import time
-from typing import List, Optional, Tuple, Union, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union, Any
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.mouse_button import MouseButton
+from selenium.webdriver.common.actions.pointer_input import PointerInput
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     ElementNotVisibleException,
-    ElementNotInteractableException
+    ElementNotInteractableException,
+    WebDriverException
 )
 from appium.webdriver.common.appiumby import AppiumBy
-from appium.webdriver.common.touch_action import TouchAction
-from appium.webdriver.common.multi_action import MultiAction
 
 from config.config_manager import config_manager
 from utils.logger import get_logger
 
 
+SCREENSHOT_DIR = "screenshots"
+
+# Screenshot files are written off the test thread
+_screenshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+
+
 class BasePage:
     """Base page class implementing Page Factory pattern for mobile automation."""
     
+    # Seconds a fetched page source is reused by get_page_source
+    _PAGE_SOURCE_TTL = 0.25
+    
+    # Android launch timing line, e.g. "Displayed com.example/.MainActivity: +1s234ms"
+    _DISPLAYED_RE = re.compile(r'Displayed (\S+?)/\S+: \+(?:(\d+)s)?(\d+)ms')
+    
+    # Native queries matching a top-level element, used to probe that a screen is live
+    _ROOT_LOCATORS = {
+        'android': (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().index(0)'),
+        'ios': (AppiumBy.IOS_CLASS_CHAIN, '**/XCUIElementTypeWindow'),
+    }
+    
+    # Screenshot file numbering and one-time directory creation
+    _shot_seq = itertools.count(1)
+    _screenshot_dir_ready = False
+    
     def __init__(self, driver):
         """Initialize base page with driver instance."""
         self.driver = driver
         self.logger = get_logger(self.__class__.__name__)
         self.timeout_config = config_manager.get_timeout_config()
-        self.wait = WebDriverWait(driver, self.timeout_config['explicit_wait'])
-        self.short_wait = WebDriverWait(driver, 5)
+        self._explicit_wait = self.timeout_config['explicit_wait']
+        self._wait_cache: Dict[Tuple[float, float], WebDriverWait] = {}
+        self._page_source_cache: Optional[Tuple[float, str]] = None
+        self._last_screenshot_write: Optional[Future] = None
+        self.platform = ((driver.capabilities or {}).get('platformName') or '').lower()
         
+        environment_config = config_manager.get_environment_config()
+        self.use_execute_driver = environment_config['use_execute_driver']
+        # mobile: gesture extensions below are UiAutomator2 commands
+        self.use_mobile_gestures = environment_config['use_mobile_gestures'] and self.platform == 'android'
+    
+    def _invalidate_page_source(self) -> None:
+        """Drop the cached page source after an action that may change the screen."""
+        self._page_source_cache = None
+    
+    def reset_state(self) -> None:
+        """Forget anything cached about the current screen, e.g. after the app restarts."""
+        self._invalidate_page_source()
+    
+    def _w(self, timeout: float, poll_frequency: float = POLL_FREQUENCY) -> WebDriverWait:
+        """Return a WebDriverWait for this timeout and poll interval, reusing one per distinct pair."""
+        key = (timeout, poll_frequency)
+        wait = self._wait_cache.get(key)
+        if wait is None:
+            wait = self._wait_cache[key] = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+        return wait
+    
+    @cached_property
+    def default_wait(self) -> WebDriverWait:
+        """WebDriverWait using the configured explicit wait, created on first use."""
+        return self._w(self._explicit_wait)
+    
+    @cached_property
+    def short_wait(self) -> WebDriverWait:
+        """Five-second WebDriverWait, created on first use."""
+        return self._w(5)
+    
+    @cached_property
+    def _window_size(self) -> dict:
+        """Screen size, fetched once per page object."""
+        return self.driver.get_window_size()
+    
     # Element Finding Methods
     def find_element(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> WebElement:
         """Find a single element with explicit wait."""
-        wait_time = timeout or self.timeout_config['explicit_wait']
+        wait_time = timeout or self._explicit_wait
         try:
-            element = WebDriverWait(self.driver, wait_time).until(
+            element = self._w(wait_time).until(
                 EC.presence_of_element_located(locator)
             )
             self.logger.debug(f"Element found: {locator}")
@@ -50,12 +122,12 @@ class BasePage:
     
     def find_elements(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> List[WebElement]:
         """Find multiple elements with explicit wait."""
-        wait_time = timeout or self.timeout_config['explicit_wait']
+        wait_time = timeout or self._explicit_wait
         try:
-            WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_element_located(locator)
+            # Poll find_elements itself so the returned list costs no extra round-trip
+            elements = self._w(wait_time).until(
+                lambda driver: driver.find_elements(*locator)
             )
-            elements = self.driver.find_elements(*locator)
             self.logger.debug(f"Found {len(elements)} elements: {locator}")
             return elements
         except TimeoutException:
@@ -65,7 +137,7 @@ class BasePage:
     def is_element_present(self, locator: Tuple[str, str], timeout: int = 5) -> bool:
         """Check if element is present without raising exception."""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._w(timeout).until(
                 EC.presence_of_element_located(locator)
             )
             return True
@@ -75,7 +147,7 @@ class BasePage:
     def is_element_visible(self, locator: Tuple[str, str], timeout: int = 5) -> bool:
         """Check if element is visible without raising exception."""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._w(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             return True
@@ -85,7 +157,7 @@ class BasePage:
     def is_element_clickable(self, locator: Tuple[str, str], timeout: int = 5) -> bool:
         """Check if element is clickable without raising exception."""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._w(timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             return True
@@ -95,6 +167,7 @@ class BasePage:
     # Element Interaction Methods
     def click_element(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> None:
         """Click on an element with explicit wait."""
+        self._invalidate_page_source()
         try:
             element = self.wait_for_element_clickable(locator, timeout)
             element.click()
@@ -105,6 +178,7 @@ class BasePage:
     
     def send_keys(self, locator: Tuple[str, str], text: str, clear_first: bool = True, timeout: Optional[int] = None) -> None:
         """Send keys to an element with explicit wait."""
+        self._invalidate_page_source()
         try:
             element = self.wait_for_element_visible(locator, timeout)
             if clear_first:
@@ -140,20 +214,30 @@ class BasePage:
     # Wait Methods
     def wait_for_element_visible(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> WebElement:
         """Wait for element to be visible."""
-        wait_time = timeout or self.timeout_config['explicit_wait']
+        wait_time = timeout or self._explicit_wait
         try:
-            element = WebDriverWait(self.driver, wait_time).until(
+            element = self._w(wait_time).until(
                 EC.visibility_of_element_located(locator)
             )
             return element
         except TimeoutException:
             raise ElementNotVisibleException(f"Element not visible within {wait_time} seconds: {locator}")
     
+    def wait_for_all_visible(self, locators: List[Tuple[str, str]], timeout: Optional[int] = None) -> List[WebElement]:
+        """Wait for several elements to be visible within a single wait."""
+        wait_time = timeout or self._explicit_wait
+        try:
+            return self._w(wait_time).until(
+                EC.all_of(*[EC.visibility_of_element_located(locator) for locator in locators])
+            )
+        except TimeoutException:
+            raise ElementNotVisibleException(f"Elements not all visible within {wait_time} seconds: {locators}")
+    
     def wait_for_element_clickable(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> WebElement:
         """Wait for element to be clickable."""
-        wait_time = timeout or self.timeout_config['explicit_wait']
+        wait_time = timeout or self._explicit_wait
         try:
-            element = WebDriverWait(self.driver, wait_time).until(
+            element = self._w(wait_time).until(
                 EC.element_to_be_clickable(locator)
             )
             return element
@@ -162,9 +246,9 @@ class BasePage:
     
     def wait_for_element_invisible(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> bool:
         """Wait for element to become invisible."""
-        wait_time = timeout or self.timeout_config['explicit_wait']
+        wait_time = timeout or self._explicit_wait
         try:
-            return WebDriverWait(self.driver, wait_time).until(
+            return self._w(wait_time).until(
                 EC.invisibility_of_element_located(locator)
             )
         except TimeoutException:
@@ -172,9 +256,9 @@ class BasePage:
     
     def wait_for_text_in_element(self, locator: Tuple[str, str], text: str, timeout: Optional[int] = None) -> bool:
         """Wait for specific text to appear in element."""
-        wait_time = timeout or self.timeout_config['explicit_wait']
+        wait_time = timeout or self._explicit_wait
         try:
-            return WebDriverWait(self.driver, wait_time).until(
+            return self._w(wait_time).until(
                 EC.text_to_be_present_in_element(locator, text)
             )
         except TimeoutException:
@@ -183,6 +267,7 @@ class BasePage:
     # Mobile Specific Methods
     def swipe(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: int = 1000) -> None:
         """Perform swipe gesture."""
+        self._invalidate_page_source()
         try:
             self.driver.swipe(start_x, start_y, end_x, end_y, duration)
             self.logger.info(f"Swiped from ({start_x}, {start_y}) to ({end_x}, {end_y})")
@@ -190,37 +275,91 @@ class BasePage:
             self.logger.error(f"Failed to swipe: {str(e)}")
             raise
     
-    def scroll_to_element(self, locator: Tuple[str, str], max_scrolls: int = 10) -> WebElement:
-        """Scroll to find an element."""
+    def scroll_to_element(self, locator: Tuple[str, str], max_scrolls: int = 10, settle_polls: int = 10) -> WebElement:
+        """Scroll to find an element, polling until the screen settles after each swipe."""
+        if self.is_element_present(locator, timeout=2):
+            return self.find_element(locator)
+        
+        size = self._window_size
+        start_x = size['width'] // 2
+        start_y = int(size['height'] * 0.8)
+        end_y = int(size['height'] * 0.2)
+        
         for i in range(max_scrolls):
-            if self.is_element_present(locator, timeout=2):
-                return self.find_element(locator)
-            
-            # Scroll down
-            size = self.driver.get_window_size()
-            start_x = size['width'] // 2
-            start_y = size['height'] * 0.8
-            end_y = size['height'] * 0.2
+            self.swipe(start_x, start_y, start_x, end_y)
             
-            self.swipe(start_x, int(start_y), start_x, int(end_y))
-            time.sleep(1)
+            # Stop polling once the element appears or the page source stops changing
+            previous = hash(self.driver.page_source)
+            for _ in range(settle_polls):
+                if self.is_element_present(locator, timeout=0):
+                    return self.find_element(locator)
+                current = hash(self.driver.page_source)
+                if current == previous:
+                    break
+                previous = current
+                time.sleep(0.05)
         
         raise NoSuchElementException(f"Element not found after {max_scrolls} scrolls: {locator}")
     
     def tap(self, x: int, y: int) -> None:
         """Tap at specific coordinates."""
+        self._invalidate_page_source()
         try:
-            TouchAction(self.driver).tap(x=x, y=y).perform()
+            if self.use_mobile_gestures:
+                self.driver.execute_script('mobile: clickGesture', {'x': x, 'y': y})
+            else:
+                self._press_at(x, y)
             self.logger.info(f"Tapped at coordinates ({x}, {y})")
         except Exception as e:
             self.logger.error(f"Failed to tap at ({x}, {y}): {str(e)}")
             raise
     
+    def _press_at(self, x: int, y: int, hold_ms: int = 0) -> None:
+        """Press and release one touch pointer at (x, y) as a W3C action, holding for hold_ms."""
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        builder = ActionBuilder(self.driver, mouse=finger)
+        finger.create_pointer_move(duration=0, x=x, y=y)
+        finger.create_pointer_down(button=MouseButton.LEFT)
+        if hold_ms:
+            finger.create_pause(hold_ms / 1000)
+        finger.create_pointer_up(button=MouseButton.LEFT)
+        builder.perform()
+    
+    def tap_batch(self, points: List[Tuple[int, int]], pause_ms: int = 200) -> None:
+        """
+        Tap several coordinates in one W3C actions request.
+        
+        Args:
+            points: (x, y) for each tap, in order
+            pause_ms: Server-side pause after each tap
+        """
+        self._invalidate_page_source()
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        builder = ActionBuilder(self.driver, mouse=finger)
+        for x, y in points:
+            finger.create_pointer_move(duration=0, x=x, y=y)
+            finger.create_pointer_down(button=MouseButton.LEFT)
+            finger.create_pointer_up(button=MouseButton.LEFT)
+            if pause_ms:
+                finger.create_pause(pause_ms / 1000)
+        
+        try:
+            builder.perform()
+            self.logger.info(f"Performed {len(points)} taps in one action sequence")
+        except Exception as e:
+            self.logger.error(f"Failed to perform tap batch: {str(e)}")
+            raise
+    
     def long_press(self, locator: Tuple[str, str], duration: int = 1000) -> None:
         """Long press on an element."""
+        self._invalidate_page_source()
         try:
             element = self.find_element(locator)
-            TouchAction(self.driver).long_press(element, duration=duration).perform()
+            if self.use_mobile_gestures:
+                self.driver.execute_script('mobile: longClickGesture', {'elementId': element.id, 'duration': duration})
+            else:
+                rect = element.rect
+                self._press_at(rect['x'] + rect['width'] // 2, rect['y'] + rect['height'] // 2, hold_ms=duration)
             self.logger.info(f"Long pressed element: {locator}")
         except Exception as e:
             self.logger.error(f"Failed to long press element {locator}: {str(e)}")
@@ -228,68 +367,253 @@ class BasePage:
     
     def pinch(self, locator: Tuple[str, str]) -> None:
         """Pinch gesture on an element."""
+        self._invalidate_page_source()
         try:
             element = self.find_element(locator)
-            action1 = TouchAction(self.driver)
-            action2 = TouchAction(self.driver)
+            if self.use_mobile_gestures:
+                self.driver.execute_script('mobile: pinchCloseGesture', {'elementId': element.id, 'percent': 0.5})
+                self.logger.info(f"Pinched element: {locator}")
+                return
             
             # Get element location and size
             location = element.location
             size = element.size
             
-            # Define pinch coordinates
-            x1 = location['x'] + size['width'] * 0.25
-            y1 = location['y'] + size['height'] * 0.25
-            x2 = location['x'] + size['width'] * 0.75
-            y2 = location['y'] + size['height'] * 0.75
-            
-            action1.press(x=x1, y=y1).move_to(x=location['x'] + size['width'] * 0.4, 
-                                            y=location['y'] + size['height'] * 0.4).release()
-            action2.press(x=x2, y=y2).move_to(x=location['x'] + size['width'] * 0.6, 
-                                            y=location['y'] + size['height'] * 0.6).release()
+            def point(fx: float, fy: float) -> Tuple[int, int]:
+                return int(location['x'] + size['width'] * fx), int(location['y'] + size['height'] * fy)
             
-            MultiAction(self.driver).add(action1).add(action2).perform()
+            # Two fingers move from opposite corners towards the centre
+            self._two_finger_strokes([
+                (point(0.25, 0.25), point(0.4, 0.4)),
+                (point(0.75, 0.75), point(0.6, 0.6)),
+            ])
             self.logger.info(f"Pinched element: {locator}")
         except Exception as e:
             self.logger.error(f"Failed to pinch element {locator}: {str(e)}")
             raise
     
+    def long_press_at(self, x: int, y: int, duration: int = 1000) -> None:
+        """Long press at specific coordinates."""
+        self._invalidate_page_source()
+        try:
+            if self.use_mobile_gestures:
+                self.driver.execute_script('mobile: longClickGesture', {'x': x, 'y': y, 'duration': duration})
+            else:
+                self._press_at(x, y, hold_ms=duration)
+            self.logger.info(f"Long pressed at coordinates ({x}, {y}) for {duration}ms")
+        except Exception as e:
+            self.logger.error(f"Failed to long press at ({x}, {y}): {str(e)}")
+            raise
+    
+    def pinch_at(self, x: int, y: int, scale: float = 0.5, radius: int = 200) -> None:
+        """
+        Pinch around specific coordinates.
+        
+        Args:
+            x, y: Centre of the gesture
+            scale: Final finger spread relative to the start; below 1 zooms out, above 1 zooms in
+            radius: Largest distance of each finger from the centre, in pixels
+        """
+        if scale <= 0 or scale == 1:
+            raise ValueError(f"Pinch scale must be positive and not 1: {scale}")
+        
+        self._invalidate_page_source()
+        try:
+            if self.use_mobile_gestures:
+                gesture = 'mobile: pinchCloseGesture' if scale < 1 else 'mobile: pinchOpenGesture'
+                self.driver.execute_script(gesture, {
+                    'left': x - radius, 'top': y - radius, 'width': 2 * radius, 'height': 2 * radius,
+                    'percent': 1 - min(scale, 1 / scale),
+                })
+            else:
+                start = radius if scale < 1 else radius / scale
+                end = start * scale
+                self._two_finger_strokes([
+                    ((int(x - start), int(y - start)), (int(x - end), int(y - end))),
+                    ((int(x + start), int(y + start)), (int(x + end), int(y + end))),
+                ])
+            self.logger.info(f"Pinched at coordinates ({x}, {y}) with scale {scale}")
+        except Exception as e:
+            self.logger.error(f"Failed to pinch at ({x}, {y}): {str(e)}")
+            raise
+    
+    def _two_finger_strokes(self, strokes: List[Tuple[Tuple[int, int], Tuple[int, int]]], duration_ms: int = 500) -> None:
+        """Drag two touch pointers from their start to their end point at the same time."""
+        builder = ActionBuilder(self.driver)
+        for index, ((start_x, start_y), (end_x, end_y)) in enumerate(strokes):
+            finger = builder.add_pointer_input(interaction.POINTER_TOUCH, f"finger{index + 1}")
+            finger.create_pointer_move(duration=0, x=start_x, y=start_y)
+            finger.create_pointer_down(button=MouseButton.LEFT)
+            finger.create_pointer_move(duration=duration_ms, x=end_x, y=end_y)
+            finger.create_pointer_up(button=MouseButton.LEFT)
+        builder.perform()
+    
+    # Batched Commands
+    # WebdriverIO selector prefix per locator strategy
+    _WDIO_PREFIXES = {
+        By.ID: 'id=',
+        AppiumBy.ACCESSIBILITY_ID: '~',
+        By.XPATH: '',
+        AppiumBy.ANDROID_UIAUTOMATOR: 'android=',
+        AppiumBy.IOS_PREDICATE: '-ios predicate string:',
+        AppiumBy.IOS_CLASS_CHAIN: '-ios class chain:',
+    }
+    
+    @classmethod
+    def to_wdio_selector(cls, locator: Tuple[str, str]) -> str:
+        """Convert a (strategy, value) locator into a quoted WebdriverIO selector."""
+        strategy, value = locator
+        try:
+            prefix = cls._WDIO_PREFIXES[strategy]
+        except KeyError:
+            raise ValueError(f"Locator strategy not supported in batch scripts: {strategy}")
+        return json.dumps(prefix + value)
+    
+    def execute_batch(self, script: str, timeout_ms: int = 60000) -> Any:
+        """
+        Run a WebdriverIO script on the Appium server in a single round-trip.
+        
+        Args:
+            script: WebdriverIO script body; ``driver`` is bound to the session
+            timeout_ms: Server-side script timeout in milliseconds
+            
+        Returns:
+            Any: Value returned by the script
+        """
+        self._invalidate_page_source()
+        try:
+            response = self.driver.execute_driver(script, script_type='webdriverio', timeout_ms=timeout_ms)
+            self.logger.debug("Executed driver script batch")
+            return response.result
+        except Exception as e:
+            self.logger.error(f"Failed to execute driver script: {str(e)}")
+            raise
+    
     # Utility Methods
+    @classmethod
+    def _screenshot_dir(cls) -> Path:
+        """Return the screenshots directory, creating it on first use."""
+        if not cls._screenshot_dir_ready:
+            os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+            cls._screenshot_dir_ready = True
+        return Path(SCREENSHOT_DIR)
+    
+    def get_screenshot_bytes(self) -> bytes:
+        """Get the current screen as PNG bytes without writing a file."""
+        return self.driver.get_screenshot_as_png()
+    
     def take_screenshot(self, filename: Optional[str] = None) -> str:
-        """Take screenshot and return file path."""
+        """
+        Take screenshot and return file path.
+        
+        The file is written in the background; call wait_for_screenshots()
+        before reading it.
+        """
         try:
             if not filename:
-                timestamp = int(time.time())
-                filename = f"screenshot_{timestamp}.png"
+                # PID keeps names unique across xdist workers sharing the directory
+                filename = f"screenshot_{int(time.time())}_{os.getpid()}_{next(BasePage._shot_seq)}.png"
+            
+            screenshot_path = self._screenshot_dir() / filename
+            png = self.get_screenshot_bytes()
             
-            screenshot_path = f"screenshots/{filename}"
-            self.driver.save_screenshot(screenshot_path)
-            self.logger.info(f"Screenshot saved: {screenshot_path}")
-            return screenshot_path
+            def log_write_result(future):
+                if future.exception():
+                    self.logger.error(f"Failed to write screenshot {screenshot_path}: {future.exception()}")
+                else:
+                    self.logger.debug(f"Screenshot saved: {screenshot_path}")
+            
+            self._last_screenshot_write = _screenshot_writer.submit(screenshot_path.write_bytes, png)
+            self._last_screenshot_write.add_done_callback(log_write_result)
+            self.logger.info(f"Screenshot queued: {screenshot_path}")
+            return str(screenshot_path)
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {str(e)}")
             raise
     
+    def wait_for_screenshots(self, timeout: Optional[float] = None) -> None:
+        """Block until the screenshots taken by this page are on disk, re-raising a write failure."""
+        # The writer runs jobs in submission order, so the last one finishing covers the rest
+        if self._last_screenshot_write is not None:
+            self._last_screenshot_write.result(timeout)
+    
     def get_page_source(self) -> str:
-        """Get current page source."""
+        """Get current page source, reusing a fetch from the last _PAGE_SOURCE_TTL seconds."""
+        cached = self._page_source_cache
+        if cached is not None and time.monotonic() - cached[0] < self._PAGE_SOURCE_TTL:
+            return cached[1]
+        
         try:
             source = self.driver.page_source
+            self._page_source_cache = (time.monotonic(), source)
             self.logger.debug("Retrieved page source")
             return source
         except Exception as e:
             self.logger.error(f"Failed to get page source: {str(e)}")
             raise
     
+    def has_page_source(self, timeout: float = 5) -> bool:
+        """
+        Check that the screen has content without transferring the page source.
+        
+        Args:
+            timeout: Seconds to wait for a top-level element
+            
+        Returns:
+            bool: True if a top-level element was found
+        """
+        locator = self._ROOT_LOCATORS.get(self.platform, (By.XPATH, '/*'))
+        try:
+            self._w(timeout).until(lambda driver: driver.find_elements(*locator))
+            return True
+        except TimeoutException:
+            self.logger.warning(f"No screen content found within {timeout} seconds")
+            return False
+    
+    def get_displayed_time(self, package: Optional[str] = None) -> Optional[float]:
+        """
+        Get the device-reported time to first frame of the latest activity launch.
+        
+        Reads the ActivityManager "Displayed" line from logcat entries logged
+        since the previous logcat read (Android only).
+        
+        Args:
+            package: Only consider launches of this package
+            
+        Returns:
+            Optional[float]: Seconds, or None if no launch line was found
+        """
+        if self.platform != 'android':
+            return None
+        
+        try:
+            entries = self.driver.get_log('logcat')
+        except Exception as e:
+            self.logger.debug(f"Logcat not available: {str(e)}")
+            return None
+        
+        for entry in reversed(entries):
+            match = self._DISPLAYED_RE.search(entry.get('message', ''))
+            if match and (package is None or match.group(1) == package):
+                return int(match.group(2) or 0) + int(match.group(3)) / 1000
+        return None
+    
     def hide_keyboard(self) -> None:
-        """Hide mobile keyboard if present."""
+        """Hide mobile keyboard if it is shown."""
+        self._invalidate_page_source()
         try:
+            if not self.driver.is_keyboard_shown():
+                self.logger.debug("Keyboard not shown")
+                return
+            
             self.driver.hide_keyboard()
             self.logger.info("Keyboard hidden")
-        except Exception as e:
+        except WebDriverException as e:
             self.logger.debug(f"Keyboard hide failed (may not be present): {str(e)}")
     
     def go_back(self) -> None:
         """Navigate back (Android back button)."""
+        self._invalidate_page_source()
         try:
             self.driver.back()
             self.logger.info("Navigated back")
@@ -297,6 +621,30 @@ class BasePage:
             self.logger.error(f"Failed to navigate back: {str(e)}")
             raise
     
+    def wait_for_idle(self, max_ms: int = 500, poll_ms: int = 50) -> bool:
+        """
+        Wait until the screen stops changing instead of sleeping a fixed time.
+        
+        Args:
+            max_ms: Upper bound on the wait in milliseconds
+            poll_ms: Delay between page source snapshots in milliseconds
+            
+        Returns:
+            bool: True if two consecutive snapshots matched before max_ms elapsed
+        """
+        self._invalidate_page_source()
+        deadline = time.monotonic() + max_ms / 1000
+        previous = hash(self.driver.page_source)
+        while time.monotonic() < deadline:
+            time.sleep(poll_ms / 1000)
+            current = hash(self.driver.page_source)
+            if current == previous:
+                return True
+            previous = current
+        
+        self.logger.debug(f"Screen still changing after {max_ms}ms")
+        return False
+    
     def wait(self, seconds: float) -> None:
         """Explicit wait for specified seconds."""
         time.sleep(seconds)
@@ -304,6 +652,7 @@ class BasePage:
     
     def refresh_page(self) -> None:
         """Refresh current page/screen."""
+        self._invalidate_page_source()
         try:
             self.driver.refresh()
             self.logger.info("Page refreshed")
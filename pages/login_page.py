@@ -3,13 +3,29 @@ Login Page Object - Example implementation of Page Factory pattern
 Demonstrates how to create page objects using the base page functionality.
 """
 
-from typing import Tuple
+import json
+import re
+import xml.etree.ElementTree as ET
+from functools import cached_property
+from typing import Any, Callable, Dict, Optional, Tuple
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementNotVisibleException,
+    ElementNotInteractableException
+)
 from appium.webdriver.common.appiumby import AppiumBy
 
 from pages.base_page import BasePage
 
 
+# Failures that mean "locator did not match", as raised by BasePage wait helpers
+_LOOKUP_ERRORS = (NoSuchElementException, ElementNotVisibleException, ElementNotInteractableException)
+
+
 class LoginPage(BasePage):
     """Login page object implementing Page Factory pattern."""
     
@@ -22,27 +38,43 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (AppiumBy.ID, "error_message")
     LOADING_INDICATOR = (AppiumBy.ID, "loading")
     
-    # Alternative locators for different platforms
-    USERNAME_FIELD_ANDROID = (AppiumBy.XPATH, "//android.widget.EditText[@resource-id='username']")
-    USERNAME_FIELD_IOS = (AppiumBy.XPATH, "//XCUIElementTypeTextField[@name='username']")
+    # Alternative locators for different platforms; native UiAutomator and
+    # predicate queries avoid a server-side XPath walk of the whole hierarchy
+    USERNAME_FIELD_ANDROID = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.EditText").resourceId("username")')
+    USERNAME_FIELD_IOS = (AppiumBy.IOS_PREDICATE, "type == 'XCUIElementTypeTextField' AND name == 'username'")
+    
+    PASSWORD_FIELD_ANDROID = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.EditText").resourceId("password")')
+    PASSWORD_FIELD_IOS = (AppiumBy.IOS_PREDICATE, "type == 'XCUIElementTypeSecureTextField' AND name == 'password'")
+    
+    LOGIN_BUTTON_ANDROID = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.Button").text("Login")')
+    LOGIN_BUTTON_IOS = (AppiumBy.IOS_PREDICATE, "type == 'XCUIElementTypeButton' AND name == 'Login'")
     
-    PASSWORD_FIELD_ANDROID = (AppiumBy.XPATH, "//android.widget.EditText[@resource-id='password']")
-    PASSWORD_FIELD_IOS = (AppiumBy.XPATH, "//XCUIElementTypeSecureTextField[@name='password']")
+    # Login form element ids as they appear in page source (Android resource-id or iOS name)
+    _LOGIN_FORM_IDS = (USERNAME_FIELD[1], PASSWORD_FIELD[1], LOGIN_BUTTON[1])
+    _LOGIN_FORM_RE = re.compile(
+        r'(?:resource-id="(?:[^"]*:id/)?|name=")(' + '|'.join(map(re.escape, _LOGIN_FORM_IDS)) + r')"'
+    )
     
-    LOGIN_BUTTON_ANDROID = (AppiumBy.XPATH, "//android.widget.Button[@text='Login']")
-    LOGIN_BUTTON_IOS = (AppiumBy.XPATH, "//XCUIElementTypeButton[@name='Login']")
+    # (username, password, login button) fallback locators per platform
+    _PLATFORM_LOCATORS = {
+        'android': (USERNAME_FIELD_ANDROID, PASSWORD_FIELD_ANDROID, LOGIN_BUTTON_ANDROID),
+        'ios': (USERNAME_FIELD_IOS, PASSWORD_FIELD_IOS, LOGIN_BUTTON_IOS),
+    }
     
     def __init__(self, driver):
         """Initialize login page."""
         super().__init__(driver)
+        
+        # Resolve platform-specific fallback locators once
+        self._username_loc, self._password_loc, self._login_loc = self._PLATFORM_LOCATORS.get(
+            self.platform, (self.USERNAME_FIELD, self.PASSWORD_FIELD, self.LOGIN_BUTTON)
+        )
         self.logger.info("Login page initialized")
     
     def is_page_loaded(self, timeout: int = 10) -> bool:
         """Check if login page is loaded."""
         try:
-            self.wait_for_element_visible(self.USERNAME_FIELD, timeout)
-            self.wait_for_element_visible(self.PASSWORD_FIELD, timeout)
-            self.wait_for_element_visible(self.LOGIN_BUTTON, timeout)
+            self.wait_for_all_visible([self.USERNAME_FIELD, self.PASSWORD_FIELD, self.LOGIN_BUTTON], timeout)
             self.logger.info("Login page loaded successfully")
             return True
         except Exception as e:
@@ -54,15 +86,10 @@ class LoginPage(BasePage):
         try:
             self.send_keys(self.USERNAME_FIELD, username, clear_first=True)
             self.logger.info(f"Entered username: {username}")
-        except Exception:
-            # Try platform-specific locator
-            platform = self.driver.capabilities.get('platformName', '').lower()
-            if platform == 'android':
-                self.send_keys(self.USERNAME_FIELD_ANDROID, username, clear_first=True)
-            elif platform == 'ios':
-                self.send_keys(self.USERNAME_FIELD_IOS, username, clear_first=True)
-            else:
+        except _LOOKUP_ERRORS:
+            if self._username_loc == self.USERNAME_FIELD:
                 raise
+            self.send_keys(self._username_loc, username, clear_first=True)
             self.logger.info(f"Entered username using platform-specific locator: {username}")
         
         return self
@@ -72,15 +99,10 @@ class LoginPage(BasePage):
         try:
             self.send_keys(self.PASSWORD_FIELD, password, clear_first=True)
             self.logger.info("Password entered")
-        except Exception:
-            # Try platform-specific locator
-            platform = self.driver.capabilities.get('platformName', '').lower()
-            if platform == 'android':
-                self.send_keys(self.PASSWORD_FIELD_ANDROID, password, clear_first=True)
-            elif platform == 'ios':
-                self.send_keys(self.PASSWORD_FIELD_IOS, password, clear_first=True)
-            else:
+        except _LOOKUP_ERRORS:
+            if self._password_loc == self.PASSWORD_FIELD:
                 raise
+            self.send_keys(self._password_loc, password, clear_first=True)
             self.logger.info("Password entered using platform-specific locator")
         
         return self
@@ -90,15 +112,10 @@ class LoginPage(BasePage):
         try:
             self.click_element(self.LOGIN_BUTTON)
             self.logger.info("Login button clicked")
-        except Exception:
-            # Try platform-specific locator
-            platform = self.driver.capabilities.get('platformName', '').lower()
-            if platform == 'android':
-                self.click_element(self.LOGIN_BUTTON_ANDROID)
-            elif platform == 'ios':
-                self.click_element(self.LOGIN_BUTTON_IOS)
-            else:
+        except _LOOKUP_ERRORS:
+            if self._login_loc == self.LOGIN_BUTTON:
                 raise
+            self.click_element(self._login_loc)
             self.logger.info("Login button clicked using platform-specific locator")
         
         return self
@@ -107,6 +124,9 @@ class LoginPage(BasePage):
         """Perform complete login action."""
         self.logger.info(f"Performing login with username: {username}")
         
+        if self.use_execute_driver:
+            return self._login_batch(username, password)
+        
         self.enter_username(username)
         self.enter_password(password)
         self.click_login_button()
@@ -117,6 +137,21 @@ class LoginPage(BasePage):
         self.logger.info("Login action completed")
         return self
     
+    def _login_batch(self, username: str, password: str) -> 'LoginPage':
+        """Fill in credentials, submit and hide the keyboard in one driver script."""
+        script = (
+            f"const u = await driver.$({self.to_wdio_selector(self.USERNAME_FIELD)});"
+            f"await u.clearValue(); await u.setValue({json.dumps(username)});"
+            f"const p = await driver.$({self.to_wdio_selector(self.PASSWORD_FIELD)});"
+            f"await p.clearValue(); await p.setValue({json.dumps(password)});"
+            f"await (await driver.$({self.to_wdio_selector(self.LOGIN_BUTTON)})).click();"
+            "try { if (await driver.isKeyboardShown()) { await driver.hideKeyboard(); } } catch (e) {}"
+        )
+        self.execute_batch(script)
+        
+        self.logger.info("Login action completed via driver script")
+        return self
+    
     def click_forgot_password(self) -> 'LoginPage':
         """Click forgot password link."""
         self.click_element(self.FORGOT_PASSWORD_LINK)
@@ -129,27 +164,59 @@ class LoginPage(BasePage):
         self.logger.info("Signup link clicked")
         return self
     
+    def get_error_if_visible(self, timeout: int = 3) -> Tuple[bool, str]:
+        """
+        Look up the error message once and report its visibility and text.
+        
+        Args:
+            timeout: Seconds to wait for the error element to exist
+            
+        Returns:
+            Tuple[bool, str]: (visible, text); text is empty when not visible
+        """
+        elements = self.find_elements(self.ERROR_MESSAGE, timeout)
+        if not elements:
+            return False, ""
+        
+        element = elements[0]
+        try:
+            if not element.is_displayed():
+                return False, ""
+            return True, element.text
+        except StaleElementReferenceException:
+            return False, ""
+    
     def get_error_message(self) -> str:
         """Get error message text."""
-        try:
-            error_text = self.get_text(self.ERROR_MESSAGE)
+        visible, error_text = self.get_error_if_visible(timeout=self._explicit_wait)
+        if visible:
             self.logger.info(f"Error message retrieved: {error_text}")
-            return error_text
-        except Exception as e:
-            self.logger.warning(f"No error message found: {str(e)}")
-            return ""
+        else:
+            self.logger.warning("No error message found")
+        return error_text
+    
+    def is_error_displayed(self, timeout: int = 1) -> bool:
+        """Quick check for a visible error message, for use right after a failed login."""
+        is_displayed, _ = self.get_error_if_visible(timeout=timeout)
+        return is_displayed
     
     def is_error_message_displayed(self) -> bool:
         """Check if error message is displayed."""
-        is_displayed = self.is_element_visible(self.ERROR_MESSAGE, timeout=5)
+        is_displayed, _ = self.get_error_if_visible(timeout=5)
         self.logger.info(f"Error message displayed: {is_displayed}")
         return is_displayed
     
+    # Seconds to wait for the loading indicator to appear before assuming there is none
+    _LOADING_APPEAR_TIMEOUT = 2
+    
     def wait_for_loading_to_complete(self, timeout: int = 30) -> bool:
         """Wait for loading indicator to disappear."""
+        if self.use_execute_driver:
+            return self._wait_for_loading_batch(timeout)
+        
         try:
             # Wait for loading indicator to appear first (optional)
-            if self.is_element_present(self.LOADING_INDICATOR, timeout=2):
+            if self.is_element_present(self.LOADING_INDICATOR, timeout=self._LOADING_APPEAR_TIMEOUT):
                 self.logger.info("Loading indicator appeared")
                 
                 # Wait for it to disappear
@@ -166,51 +233,156 @@ class LoginPage(BasePage):
             self.logger.error(f"Error waiting for loading to complete: {str(e)}")
             return False
     
-    def is_login_successful(self) -> bool:
+    def _login_form_present(self, driver) -> bool:
+        """Check a single page source dump for all three login form elements."""
+        found = set(self._LOGIN_FORM_RE.findall(driver.page_source))
+        return len(found) == len(self._LOGIN_FORM_IDS)
+    
+    def _wait_for_loading_batch(self, timeout: int) -> bool:
+        """Wait for the loading indicator to come and go on the server in one driver script."""
+        script = (
+            f"const el = await driver.$({self.to_wdio_selector(self.LOADING_INDICATOR)});"
+            f"const appeared = await el.waitForExist({{timeout: {self._LOADING_APPEAR_TIMEOUT * 1000}}})"
+            ".then(() => true, () => false);"
+            "if (!appeared) { return 'absent'; }"
+            f"return await el.waitForDisplayed({{timeout: {timeout * 1000}, reverse: true}})"
+            ".then(() => 'done', () => 'timeout');"
+        )
+        try:
+            outcome = self.execute_batch(script, timeout_ms=(timeout + self._LOADING_APPEAR_TIMEOUT + 5) * 1000)
+        except Exception as e:
+            self.logger.error(f"Error waiting for loading to complete: {str(e)}")
+            return False
+        
+        if outcome == 'timeout':
+            self.logger.warning("Loading indicator did not disappear within timeout")
+            return False
+        self.logger.info("Loading completed" if outcome == 'done' else "No loading indicator found")
+        return True
+    
+    def _form_node_attributes(self) -> Dict[str, Optional[Dict[str, str]]]:
+        """Attributes of each login form element from one page source dump (None if absent)."""
+        ios = self.platform == 'ios'
+        nodes: Dict[str, Optional[Dict[str, str]]] = dict.fromkeys(self._LOGIN_FORM_IDS)
+        
+        for node in ET.fromstring(self.get_page_source()).iter():
+            # Android resource ids may carry a "package:id/" prefix
+            element_id = node.get('name') if ios else (node.get('resource-id') or '').rsplit('/', 1)[-1]
+            if element_id in nodes:
+                nodes[element_id] = node.attrib
+        
+        return nodes
+    
+    def get_accessibility_descriptions(self) -> Dict[str, Optional[str]]:
+        """
+        Read the accessibility label of each login form element from one page source dump.
+        
+        Returns:
+            Dict: Element id (username, password, login_button) -> label, or None if not found
+        """
+        attribute = 'name' if self.platform == 'ios' else 'content-desc'
+        return {
+            element_id: attrs.get(attribute) if attrs is not None else None
+            for element_id, attrs in self._form_node_attributes().items()
+        }
+    
+    def snapshot_elements(self) -> Dict[str, Dict[str, bool]]:
+        """
+        Read visibility and enabled state of the login form from one page source dump.
+        
+        Returns:
+            Dict: Element id -> {'displayed': bool, 'enabled': bool}; both False if not found
+        """
+        visible_attribute = 'visible' if self.platform == 'ios' else 'displayed'
+        return {
+            element_id: {
+                'displayed': attrs is not None and attrs.get(visible_attribute) == 'true',
+                'enabled': attrs is not None and attrs.get('enabled') == 'true',
+            }
+            for element_id, attrs in self._form_node_attributes().items()
+        }
+    
+    def is_on_login_screen(self) -> bool:
+        """Check, from one page source dump and without waiting, whether the login form is shown."""
+        try:
+            return self._login_form_present(self.driver)
+        except Exception as e:
+            self.logger.error(f"Error checking for login screen: {str(e)}")
+            return False
+    
+    def is_login_successful(self, timeout: int = 3) -> bool:
         """Check if login was successful by verifying page navigation."""
         try:
             # Wait for loading to complete
             self.wait_for_loading_to_complete()
             
-            # Check if we're no longer on login page
-            # This could be checking for absence of login elements or presence of home page elements
-            login_elements_present = (
-                self.is_element_present(self.USERNAME_FIELD, timeout=3) and
-                self.is_element_present(self.PASSWORD_FIELD, timeout=3) and
-                self.is_element_present(self.LOGIN_BUTTON, timeout=3)
+            # Poll the page source until the login form is gone
+            self._w(timeout, poll_frequency=0.2).until(
+                lambda d: not self._login_form_present(d)
             )
+            self.logger.info("Login successful: True")
+            return True
             
-            success = not login_elements_present
-            self.logger.info(f"Login successful: {success}")
-            return success
-            
+        except TimeoutException:
+            self.logger.info("Login successful: False")
+            return False
         except Exception as e:
             self.logger.error(f"Error checking login success: {str(e)}")
             return False
     
+    # Cached form elements; re-resolved once if they go stale
+    @cached_property
+    def _username_el(self) -> WebElement:
+        """Username field element, resolved on first use."""
+        return self.find_element(self.USERNAME_FIELD)
+    
+    @cached_property
+    def _password_el(self) -> WebElement:
+        """Password field element, resolved on first use."""
+        return self.find_element(self.PASSWORD_FIELD)
+    
+    @cached_property
+    def _login_button_el(self) -> WebElement:
+        """Login button element, resolved on first use."""
+        return self.find_element(self.LOGIN_BUTTON)
+    
+    _CACHED_ELEMENTS = ('_username_el', '_password_el', '_login_button_el')
+    
+    def reset_state(self) -> None:
+        """Forget cached screen state, including the resolved form elements."""
+        super().reset_state()
+        for name in self._CACHED_ELEMENTS:
+            self.__dict__.pop(name, None)
+    
+    def _on_cached_element(self, name: str, action: Callable[[WebElement], Any]) -> Any:
+        """Run an action on a cached element, looking it up again if it went stale."""
+        try:
+            return action(getattr(self, name))
+        except StaleElementReferenceException:
+            self.__dict__.pop(name, None)
+            return action(getattr(self, name))
+    
     def clear_username_field(self) -> 'LoginPage':
         """Clear username field."""
-        element = self.find_element(self.USERNAME_FIELD)
-        element.clear()
+        self._on_cached_element('_username_el', lambda element: element.clear())
         self.logger.info("Username field cleared")
         return self
     
     def clear_password_field(self) -> 'LoginPage':
         """Clear password field."""
-        element = self.find_element(self.PASSWORD_FIELD)
-        element.clear()
+        self._on_cached_element('_password_el', lambda element: element.clear())
         self.logger.info("Password field cleared")
         return self
     
     def get_username_field_text(self) -> str:
         """Get current text in username field."""
-        text = self.get_attribute(self.USERNAME_FIELD, "text")
+        text = self._on_cached_element('_username_el', lambda element: element.get_attribute("text"))
         self.logger.info(f"Username field text: {text}")
         return text
     
     def is_login_button_enabled(self) -> bool:
         """Check if login button is enabled."""
-        enabled = self.get_attribute(self.LOGIN_BUTTON, "enabled") == "true"
+        enabled = self._on_cached_element('_login_button_el', lambda element: element.get_attribute("enabled")) == "true"
         self.logger.info(f"Login button enabled: {enabled}")
         return enabled
     
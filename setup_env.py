@@ -13,25 +13,105 @@ Features:
 - Provides setup verification
 
 Usage:
-    python3 setup_env.py
+    python3 setup_env.py [--force | --keep]
 """
 
+import argparse
 import os
 import sys
+import hashlib
+import shutil
+import stat
 import subprocess
 import platform
+import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# pip releases at or above this already handle everything in requirements.txt
+MIN_PIP_VERSION = (23, 0)
+
+
+def _chmod_and_retry(func, path, _exc):
+    """rmtree error handler: clear the read-only bit and retry the failed operation."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def remove_tree(path):
+    """Delete a directory tree in-process, including read-only files."""
+    # onerror is deprecated from Python 3.12 in favour of onexc (same call shape here)
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_chmod_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_chmod_and_retry)
+
+
+class VenvProbe:
+    """
+    Long-lived venv interpreter answering module lookups over stdin/stdout.
+    
+    One process serves any number of checks, so interpreter startup is paid once.
+    """
+    
+    # Reads one module name per line and answers "True"/"False" via find_spec,
+    # which locates a module without executing it
+    _SERVER = (
+        "import importlib.util, sys\n"
+        "for line in sys.stdin:\n"
+        "    name = line.strip()\n"
+        "    try:\n"
+        "        found = importlib.util.find_spec(name) is not None\n"
+        "    except Exception:\n"
+        "        found = False\n"
+        "    print(found, flush=True)\n"
+    )
+    
+    def __init__(self, python_path):
+        self.process = subprocess.Popen(
+            [str(python_path), "-u", "-c", self._SERVER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+    
+    def has_module(self, name):
+        """Return True if the venv can locate the module."""
+        self.process.stdin.write(name + "\n")
+        self.process.stdin.flush()
+        return self.process.stdout.readline().strip() == "True"
+    
+    def close(self):
+        """Stop the probe interpreter."""
+        self.process.stdin.close()
+        self.process.wait()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class EnvironmentSetup:
     """Handles Python environment setup for mobile automation framework."""
     
-    def __init__(self):
+    def __init__(self, force=False, keep=False):
         self.project_root = Path(__file__).parent
         self.venv_name = "mobile_automation_env"
         self.venv_path = self.project_root / self.venv_name
         self.requirements_file = self.project_root / "requirements.txt"
         self.python_executable = sys.executable
+        self.venv_created = False
+        self.pip_cache_dir = Path.home() / ".cache" / "pip"
+        self.wheels_dir = self.project_root / ".wheels"
+        self.download_workers = 4
+        self.deps_sentinel = self.venv_path / ".deps.sha256"
+        # Answer for an existing venv: recreate (force), reuse (keep) or ask
+        self.force = force
+        self.keep = keep
         
     def print_header(self):
         """Print setup header."""
@@ -62,20 +142,33 @@ class EnvironmentSetup:
         
         if self.venv_path.exists():
             print(f"⚠️  Virtual environment already exists at: {self.venv_path}")
-            response = input("Do you want to recreate it? (y/N): ").lower().strip()
-            if response == 'y':
+            if self.force:
+                recreate = True
+            elif self.keep or not sys.stdin.isatty():
+                # Never block on a prompt in CI or other non-interactive runs
+                recreate = False
+            else:
+                recreate = input("Do you want to recreate it? (y/N): ").lower().strip() == 'y'
+            
+            if recreate:
                 print("🗑️  Removing existing virtual environment...")
-                self._run_command(f"rm -rf {self.venv_path}")
+                remove_tree(self.venv_path)
             else:
                 print("📁 Using existing virtual environment")
                 return True
         
         try:
-            # Create virtual environment
-            self._run_command(f"{self.python_executable} -m venv {self.venv_path}")
+            # Create virtual environment in-process; symlink the interpreter where supported
+            builder = venv.EnvBuilder(
+                with_pip=True,
+                upgrade_deps=False,
+                symlinks=(platform.system() != "Windows")
+            )
+            builder.create(str(self.venv_path))
+            self.venv_created = True
             print(f"✅ Virtual environment created successfully at: {self.venv_path}")
             return True
-        except subprocess.CalledProcessError as e:
+        except (OSError, subprocess.CalledProcessError) as e:
             print(f"❌ Failed to create virtual environment: {e}")
             return False
     
@@ -93,19 +186,82 @@ class EnvironmentSetup:
         else:
             return self.venv_path / "bin" / "pip"
     
+    def get_venv_pip_version(self):
+        """
+        Read the venv's pip version from its dist-info directory name.
+        
+        Avoids starting an interpreter just to ask pip for its version.
+        Returns a (major, minor) tuple, or None if it cannot be determined.
+        """
+        patterns = ("Lib/site-packages/pip-*.dist-info", "lib/python*/site-packages/pip-*.dist-info")
+        for pattern in patterns:
+            for dist_info in self.venv_path.glob(pattern):
+                version = dist_info.name[len("pip-"):-len(".dist-info")]
+                try:
+                    return tuple(int(part) for part in version.split(".")[:2])
+                except ValueError:
+                    continue
+        return None
+    
     def upgrade_pip(self):
         """Upgrade pip in virtual environment."""
+        pip_version = self.get_venv_pip_version()
+        if pip_version and pip_version >= MIN_PIP_VERSION:
+            print(f"✅ Pip {'.'.join(map(str, pip_version))} is recent enough, skipping upgrade")
+            return True
+        
         print("📦 Upgrading pip...")
         
         try:
             pip_path = self.get_venv_pip()
-            self._run_command(f"{pip_path} install --upgrade pip")
+            self._run_command([str(pip_path), "install", "--upgrade", "pip"])
             print("✅ Pip upgraded successfully")
             return True
         except subprocess.CalledProcessError as e:
             print(f"⚠️  Warning: Failed to upgrade pip: {e}")
             return False
     
+    def _read_requirements(self):
+        """Return the requirement specifiers listed in requirements.txt."""
+        requirements = []
+        for line in self.requirements_file.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                requirements.append(line)
+        return requirements
+    
+    def prefetch_wheels(self):
+        """Download requirement wheels into .wheels/ with several pip processes in parallel."""
+        requirements = self._read_requirements()
+        if not requirements:
+            return False
+        
+        print(f"📥 Prefetching wheels into {self.wheels_dir.name}/ ...")
+        self.wheels_dir.mkdir(exist_ok=True)
+        pip_path = self.get_venv_pip()
+        
+        # Round-robin the requirements over the workers; downloads are network-bound
+        workers = min(self.download_workers, len(requirements))
+        chunks = [requirements[i::workers] for i in range(workers)]
+        commands = [
+            [
+                str(pip_path), "download",
+                "--prefer-binary",
+                "--cache-dir", str(self.pip_cache_dir),
+                "--dest", str(self.wheels_dir),
+                *chunk
+            ]
+            for chunk in chunks
+        ]
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._run_command, commands))
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️  Warning: Failed to prefetch wheels, installing online: {e}")
+            return False
+    
     def install_dependencies(self):
         """Install project dependencies."""
         print("📚 Installing project dependencies...")
@@ -114,9 +270,33 @@ class EnvironmentSetup:
             print(f"❌ Requirements file not found: {self.requirements_file}")
             return False
         
+        requirements_hash = hashlib.sha256(self.requirements_file.read_bytes()).hexdigest()
+        if self.deps_sentinel.exists() and self.deps_sentinel.read_text().strip() == requirements_hash:
+            print("✅ Dependencies unchanged, skipping install")
+            return True
+        
+        pip_path = self.get_venv_pip()
+        # Wheels only where available, shared cache across venv recreations, no .pyc pass
+        install_command = [
+            str(pip_path), "install",
+            "--no-compile",
+            "--prefer-binary",
+            "--cache-dir", str(self.pip_cache_dir),
+            "-r", str(self.requirements_file)
+        ]
+        
+        if self.prefetch_wheels():
+            try:
+                self._run_command(install_command + ["--no-index", "--find-links", str(self.wheels_dir)])
+                self.deps_sentinel.write_text(requirements_hash)
+                print("✅ Dependencies installed successfully")
+                return True
+            except subprocess.CalledProcessError as e:
+                print(f"⚠️  Offline install from {self.wheels_dir.name}/ failed, retrying online: {e}")
+        
         try:
-            pip_path = self.get_venv_pip()
-            self._run_command(f"{pip_path} install -r {self.requirements_file}")
+            self._run_command(install_command)
+            self.deps_sentinel.write_text(requirements_hash)
             print("✅ Dependencies installed successfully")
             return True
         except subprocess.CalledProcessError as e:
@@ -127,33 +307,31 @@ class EnvironmentSetup:
         """Verify the installation by checking key packages."""
         print("🔍 Verifying installation...")
         
-        key_packages = [
-            "appium-python-client",
-            "pytest",
-            "selenium",
-            "allure-pytest",
-            "loguru",
-            "pyyaml"
-        ]
+        # Distribution name -> importable module name
+        key_packages = {
+            "appium-python-client": "appium",
+            "pytest": "pytest",
+            "selenium": "selenium",
+            "allure-pytest": "allure_pytest",
+            "loguru": "loguru",
+            "pyyaml": "yaml"
+        }
         
-        python_path = self.get_venv_python()
         failed_packages = []
+        with VenvProbe(self.get_venv_python()) as probe:
+            found = {module for module in key_packages.values() if probe.has_module(module)}
         
-        for package in key_packages:
-            try:
-                result = subprocess.run(
-                    [str(python_path), "-c", f"import {package.replace('-', '_')}"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+        for package, module in key_packages.items():
+            if module in found:
                 print(f"  ✅ {package}")
-            except subprocess.CalledProcessError:
+            else:
                 print(f"  ❌ {package}")
                 failed_packages.append(package)
         
         if failed_packages:
             print(f"⚠️  Some packages failed to import: {', '.join(failed_packages)}")
+            # Force a reinstall next run
+            self.deps_sentinel.unlink(missing_ok=True)
             return False
         
         print("✅ All key packages verified successfully")
@@ -239,9 +417,9 @@ Happy Testing! 🚀
 """)
     
     def _run_command(self, command):
-        """Run shell command and handle errors."""
-        print(f"  Running: {command}")
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        """Run a command given as an argument list (no shell) and handle errors."""
+        print(f"  Running: {' '.join(command)}")
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         return result
     
     def setup(self):
@@ -256,8 +434,9 @@ Happy Testing! 🚀
         if not self.create_virtual_environment():
             return False
         
-        # Upgrade pip
-        self.upgrade_pip()
+        # Upgrade pip (a freshly created venv already has the bundled pip)
+        if not self.venv_created:
+            self.upgrade_pip()
         
         # Install dependencies
         if not self.install_dependencies():
@@ -276,10 +455,28 @@ Happy Testing! 🚀
         return True
 
 
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Set up the mobile automation Python environment.")
+    existing = parser.add_mutually_exclusive_group()
+    existing.add_argument(
+        "--force",
+        action="store_true",
+        help="Recreate the virtual environment if it already exists"
+    )
+    existing.add_argument(
+        "--keep",
+        action="store_true",
+        help="Reuse an existing virtual environment without prompting"
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main function."""
+    args = parse_args()
     try:
-        setup = EnvironmentSetup()
+        setup = EnvironmentSetup(force=args.force, keep=args.keep)
         success = setup.setup()
         
         if success:
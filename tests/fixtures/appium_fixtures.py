@@ -7,6 +7,7 @@ from appium import webdriver
 from appium.options.common.base import AppiumOptions
 from config.device_config import DEVICE_CONFIG, APP_CONFIG, WAIT_CONFIG
 from data.test_data import SCOPEX_TEST_DATA
+from tests.utils.wait_utils import release_driver
 
 
 @pytest.fixture(scope="session")
@@ -15,26 +16,24 @@ def appium_options():
     options = AppiumOptions()
     
     # Device configuration
-    options.load_capabilities({
+    caps = {
         "appium:automationName": DEVICE_CONFIG["automation_name"],
         "appium:deviceName": DEVICE_CONFIG["device_name"],
         "platformName": DEVICE_CONFIG["platform_name"],
-    })
+    }
     
     # App configuration
     if APP_CONFIG["package_name"]:
-        options.load_capabilities({
+        caps.update({
             "appium:appPackage": APP_CONFIG["package_name"],
             "appium:appActivity": APP_CONFIG["activity_name"],
         })
     
     if APP_CONFIG["app_path"]:
-        options.load_capabilities({
-            "appium:app": APP_CONFIG["app_path"]
-        })
+        caps["appium:app"] = APP_CONFIG["app_path"]
     
     # Additional capabilities
-    options.load_capabilities({
+    caps.update({
         "appium:autoGrantPermissions": APP_CONFIG["auto_grant_permissions"],
         "appium:ensureWebviewsHavePages": APP_CONFIG["ensure_webviews_have_pages"],
         "appium:nativeWebScreenshot": APP_CONFIG["native_web_screenshot"],
@@ -42,6 +41,9 @@ def appium_options():
         "appium:connectHardwareKeyboard": APP_CONFIG["connect_hardware_keyboard"]
     })
     
+    # Load everything in a single pass
+    options.load_capabilities(caps)
+    
     return options
 
 
@@ -58,6 +60,7 @@ def driver(appium_options):
     yield driver
     
     print("🔚 Closing driver...")
+    release_driver(driver)
     driver.quit()
 
 
@@ -0,0 +1,82 @@
+"""
+FastConfigParser Test Cases
+Checks the regex-based INI parser against configparser for the supported format,
+and ConfigManager lookups built on top of it.
+"""
+
+import configparser
+
+import pytest
+
+from config.config_manager import FastConfigParser, config_manager
+
+
+# Empty values and a bare key between ordinary pairs; no match may run into the next line
+INI_TEXT = (
+    "[DEFAULT]\n"
+    "shared = 1\n"
+    "[A]\n"
+    "empty =\n"
+    "next = v\n"
+    "foo\n"
+    "bar = baz\n"
+    "; comment\n"
+    "# comment\n"
+    "colon: spaced value  \n"
+    "blank:\n"
+    "[B]\n"
+    "key = other\n"
+)
+
+
+def _parse_both(text):
+    """Parse text with FastConfigParser and with configparser (bare keys allowed)"""
+    fast = FastConfigParser()
+    fast.read_string(text)
+    reference = configparser.ConfigParser(allow_no_value=True, interpolation=None)
+    reference.read_string(text)
+    return fast, reference
+
+
+@pytest.mark.unit
+class TestFastConfigParser:
+    """Test class for FastConfigParser parity with configparser"""
+    
+    @pytest.mark.parametrize("section", ["A", "B"])
+    def test_items_match_configparser(self, section):
+        """Test that every valued key parses exactly as configparser reads it"""
+        fast, reference = _parse_both(INI_TEXT)
+        expected = {key: value for key, value in reference.items(section) if value is not None}
+        assert dict(fast.items(section)) == expected
+    
+    def test_empty_values_stay_on_their_line(self):
+        """Test that an empty value does not swallow the following line"""
+        fast, reference = _parse_both(INI_TEXT)
+        assert fast.get("A", "empty") == reference.get("A", "empty") == ""
+        assert fast.get("A", "blank") == reference.get("A", "blank") == ""
+        assert fast.get("A", "next") == reference.get("A", "next") == "v"
+    
+    def test_bare_key_is_ignored(self):
+        """Test that a key without a delimiter is skipped without merging into the next key"""
+        fast, _ = _parse_both(INI_TEXT)
+        assert fast.get("A", "foo", fallback=None) is None
+        assert fast.get("A", "bar") == "baz"
+        assert not any("\n" in key for key, _ in fast.items("A"))
+
+
+@pytest.mark.unit
+class TestConfigValueLookup:
+    """Test class for ConfigManager.get_config_value fallbacks"""
+    
+    def test_missing_section_returns_fallback(self):
+        """Test that a fallback is returned for a section that does not exist"""
+        assert config_manager.get_config_value("NOPE", "x", "fb") == "fb"
+    
+    def test_missing_key_returns_fallback(self):
+        """Test that a fallback is returned for a key missing from an existing section"""
+        assert config_manager.get_config_value("TIMEOUT", "no_such_key", "fb") == "fb"
+    
+    def test_missing_section_without_fallback_raises(self):
+        """Test that a missing section without a fallback raises NoSectionError"""
+        with pytest.raises(configparser.NoSectionError):
+            config_manager.get_config_value("NOPE", "x")
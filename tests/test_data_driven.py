@@ -3,84 +3,75 @@ Example test file demonstrating data-driven testing capabilities
 using the test data management framework.
 """
 
+import statistics
 import pytest
 import time
-from pages.login_page import LoginPage
-from utils.soft_assert import SoftAssert
+
+
+# Timed login iterations in test_login_performance (after one warm-up run)
+LOGIN_PERF_RUNS = 3
 
 
 class TestDataDrivenLogin:
     """Test class demonstrating data-driven login testing"""
     
-    def test_login_with_valid_users(self, driver, test_users, soft_assert, test_logger):
-        """Test login with all valid users from test data"""
-        test_logger.test_start("Testing login with multiple valid users")
-        login_page = LoginPage(driver)
+    def test_login_with_valid_user(self, login_page, valid_user, test_logger):
+        """Test login for one valid user from test data"""
+        test_logger.test_start(f"Testing login for user: {valid_user['username']}")
         
-        for user in test_users:
-            test_logger.step(f"Testing login for user: {user['username']}")
-            
-            # Navigate to login page
+        # Navigate to login page unless a previous logout already left us there
+        if not login_page.is_on_login_screen():
             login_page.navigate_to_login()
-            
-            # Perform login
-            login_page.login(user['username'], user['password'])
-            
-            # Verify login success
-            soft_assert.assert_true(
-                login_page.is_login_successful(),
-                f"Login should be successful for user: {user['username']}"
-            )
-            
-            # Logout for next iteration
-            if login_page.is_login_successful():
-                login_page.logout()
         
-        soft_assert.assert_all()
+        # Perform login
+        login_page.login(valid_user['username'], valid_user['password'])
+        
+        # Verify login success
+        assert login_page.is_login_successful(), \
+            f"Login should be successful for user: {valid_user['username']}"
+        
+        login_page.logout()
         test_logger.test_end("COMPLETED")
     
-    def test_login_with_invalid_users(self, driver, invalid_users, soft_assert, test_logger):
-        """Test login with invalid users and verify error messages"""
-        test_logger.test_start("Testing login with invalid users")
-        login_page = LoginPage(driver)
+    def test_login_with_invalid_user(self, login_page, invalid_user, soft_assert, test_logger):
+        """Test login for one invalid user and verify the error message"""
+        test_logger.test_start(f"Testing invalid login for: {invalid_user['username']}")
         
-        for user in invalid_users:
-            test_logger.step(f"Testing invalid login for: {user['username']}")
-            
-            # Navigate to login page
+        # Navigate to login page unless a previous logout already left us there
+        if not login_page.is_on_login_screen():
             login_page.navigate_to_login()
-            
-            # Attempt login with invalid credentials
-            login_page.login(user['username'], user['password'])
-            
-            # Verify login failure
-            soft_assert.assert_true(
-                login_page.is_error_displayed(),
-                f"Error should be displayed for invalid user: {user['username']}"
+        
+        # Attempt login with invalid credentials
+        login_page.login(invalid_user['username'], invalid_user['password'])
+        
+        # Verify login failure
+        soft_assert.assert_true(
+            login_page.is_error_displayed(),
+            lambda: f"Error should be displayed for invalid user: {invalid_user['username']}"
+        )
+        
+        # Verify specific error message if provided
+        if 'expected_error' in invalid_user:
+            actual_error = login_page.get_error_message()
+            soft_assert.assert_equal(
+                actual_error, 
+                invalid_user['expected_error'],
+                lambda: f"Expected specific error message for user: {invalid_user['username']}"
             )
-            
-            # Verify specific error message if provided
-            if 'expected_error' in user:
-                actual_error = login_page.get_error_message()
-                soft_assert.assert_equal(
-                    actual_error, 
-                    user['expected_error'],
-                    f"Expected specific error message for user: {user['username']}"
-                )
         
         soft_assert.assert_all()
         test_logger.test_end("COMPLETED")
     
-    def test_login_scenarios(self, driver, login_scenarios, test_logger):
+    def test_login_scenarios(self, login_page, login_scenarios, test_logger):
         """Test login using predefined scenarios"""
         test_logger.test_start("Testing login scenarios")
-        login_page = LoginPage(driver)
         
         for scenario in login_scenarios:
-            test_logger.step(f"Testing scenario: {scenario['description']}")
+            test_logger.step("Testing scenario: %s", scenario['description'])
             
-            # Navigate to login page
-            login_page.navigate_to_login()
+            # The previous scenario's logout may already have left us on the login screen
+            if not login_page.is_on_login_screen():
+                login_page.navigate_to_login()
             
             # Perform login
             login_page.login(scenario['username'], scenario['password'])
@@ -95,7 +86,7 @@ class TestDataDrivenLogin:
         test_logger.test_end("COMPLETED")
     
     @pytest.mark.parametrize("user_id", ["user_001", "user_002", "user_003"])
-    def test_parametrized_login(self, driver, data_manager, user_id, test_logger):
+    def test_parametrized_login(self, login_page, data_manager, user_id, test_logger):
         """Test login using parametrized user IDs"""
         test_logger.test_start(f"Testing parametrized login for {user_id}")
         
@@ -103,8 +94,6 @@ class TestDataDrivenLogin:
         user = data_manager.get_user_by_id(user_id, "valid_users")
         assert user is not None, f"User {user_id} not found in test data"
         
-        login_page = LoginPage(driver)
-        
         # Navigate and login
         login_page.navigate_to_login()
         login_page.login(user['username'], user['password'])
@@ -123,7 +112,7 @@ class TestDataDrivenDeviceConfiguration:
         test_logger.test_start("Testing device compatibility")
         
         for device in device_configs:
-            test_logger.step(f"Testing device: {device['device_name']}")
+            test_logger.step("Testing device: %s", device['device_name'])
             
             # Verify device configuration
             assert device['platform'] in ['Android', 'iOS'], f"Invalid platform: {device['platform']}"
@@ -141,7 +130,7 @@ class TestDataDrivenDeviceConfiguration:
         assert len(high_priority_devices) > 0, "No high priority devices found"
         
         for device in high_priority_devices:
-            test_logger.step(f"Testing high priority device: {device['device_name']}")
+            test_logger.step("Testing high priority device: %s", device['device_name'])
             
             # Verify it's actually high priority
             assert device['test_priority'] == 'high', f"Device {device['device_name']} is not high priority"
@@ -191,7 +180,7 @@ class TestDataDrivenAppConfiguration:
 class TestDataDrivenPerformance:
     """Test class demonstrating performance testing with data"""
     
-    def test_login_performance(self, driver, test_user, performance_benchmarks, test_logger):
+    def test_login_performance(self, login_page, restart_app, test_user, performance_benchmarks, test_logger):
         """Test login performance against benchmarks"""
         test_logger.test_start("Testing login performance")
         
@@ -199,44 +188,27 @@ class TestDataDrivenPerformance:
         login_benchmark = performance_benchmarks.get('page_load_times', {}).get('login_page', 5.0)
         test_logger.info(f"Login benchmark: {login_benchmark}s")
         
-        login_page = LoginPage(driver)
+        def timed_login():
+            """Relaunch the app, then time one login and return its duration in seconds."""
+            # A fresh launch puts every run on the login screen; cached elements belong to the old one
+            restart_app()
+            login_page.reset_state()
+            start_ns = time.perf_counter_ns()
+            login_page.login(test_user['username'], test_user['password'])
+            return (time.perf_counter_ns() - start_ns) / 1e9
         
-        # Measure login performance
-        start_time = time.time()
+        # Warm-up run absorbs first-call connection and cache effects
+        timed_login()
         
-        login_page.navigate_to_login()
-        login_page.login(test_user['username'], test_user['password'])
-        
-        end_time = time.time()
-        login_duration = end_time - start_time
+        # Assert on the median of several runs to reject outliers
+        login_duration = statistics.median(timed_login() for _ in range(LOGIN_PERF_RUNS))
         
-        test_logger.info(f"Actual login duration: {login_duration:.2f}s")
+        test_logger.info(f"Median login duration: {login_duration:.2f}s over {LOGIN_PERF_RUNS} runs")
         
         # Verify performance
         assert login_duration <= login_benchmark, f"Login took {login_duration:.2f}s, expected <= {login_benchmark}s"
         
         test_logger.test_end("COMPLETED")
-    
-    def test_api_response_performance(self, performance_benchmarks, test_logger):
-        """Test API response time against benchmarks"""
-        test_logger.test_start("Testing API performance")
-        
-        api_benchmarks = performance_benchmarks.get('api_response_times', {})
-        
-        for endpoint, expected_time in api_benchmarks.items():
-            test_logger.step(f"Testing {endpoint} API performance")
-            
-            # Simulate API call timing (replace with actual API calls)
-            start_time = time.time()
-            time.sleep(0.1)  # Simulate API call
-            end_time = time.time()
-            
-            actual_time = end_time - start_time
-            test_logger.info(f"{endpoint} response time: {actual_time:.2f}s (expected <= {expected_time}s)")
-            
-            assert actual_time <= expected_time, f"{endpoint} API too slow: {actual_time:.2f}s > {expected_time}s"
-        
-        test_logger.test_end("COMPLETED")
 
 
 class TestDataValidation:
@@ -303,13 +275,13 @@ class TestCrossPlatformData:
             # iOS-specific validations
             for device in devices:
                 assert device['platform'] == 'iOS', f"Expected iOS device, got {device['platform']}"
-                test_logger.step(f"iOS device validated: {device['device_name']}")
+                test_logger.step("iOS device validated: %s", device['device_name'])
         
         elif platform == "Android":
             # Android-specific validations
             for device in devices:
                 assert device['platform'] == 'Android', f"Expected Android device, got {device['platform']}"
-                test_logger.step(f"Android device validated: {device['device_name']}")
+                test_logger.step("Android device validated: %s", device['device_name'])
         
         test_logger.test_end("COMPLETED")
     
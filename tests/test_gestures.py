@@ -4,238 +4,134 @@ Shows how to use gestures, mobile interactions, and cross-platform testing.
 """
 
 import pytest
-from pages.base_page import BasePage
+
+
+# Finger travel per direction as (start_x, start_y, end_x, end_y) ScreenAnchors fields
+SWIPE_VECTORS = {
+    "right": ("left", "cy", "right", "cy"),
+    "left": ("right", "cy", "left", "cy"),
+    "up": ("cx", "mid_lower", "cx", "mid_upper"),
+    "down": ("cx", "mid_upper", "cx", "mid_lower"),
+}
+
+# (direction, multiple of --gesture-duration-ms); each case is its own test node for xdist to distribute
+SWIPE_CASES = [
+    ("right", 1.0),
+    ("left", 1.0),
+    ("up", 1.0),
+    ("down", 1.0),
+    ("up", 0.5),
+    ("down", 0.5),
+    ("left", 0.8),
+    ("right", 0.8),
+    ("up", 1.5),
+    ("down", 1.5),
+]
+
+# Android only reports a long press once the touch is held past ~500ms
+LONG_PRESS_MIN_MS = 600
 
 
 class TestMobileGestures:
     """Test class for mobile gesture functionality."""
     
-    def test_swipe_gestures(self, driver, test_logger, soft_assert):
-        """Test various swipe gestures."""
-        test_logger.test_start("Test swipe gestures")
-        
-        base_page = BasePage(driver)
-        
-        test_logger.step("Get screen dimensions")
-        screen_size = driver.get_window_size()
-        width = screen_size['width']
-        height = screen_size['height']
-        
-        test_logger.step(f"Screen size: {width}x{height}")
+    @pytest.mark.xdist_group(name="gestures")
+    @pytest.mark.parametrize("direction,scale", SWIPE_CASES, ids=[f"{d}-x{scale}" for d, scale in SWIPE_CASES])
+    def test_swipe(self, base_page, screen_anchors, gesture_duration_ms, test_logger, soft_assert, direction, scale):
+        """Test a swipe in one direction with a scaled gesture duration."""
+        duration = int(gesture_duration_ms * scale)
+        test_logger.test_start(f"Test swipe {direction} with duration {duration}ms")
         
-        # Test swipe right
-        test_logger.step("Test swipe right")
-        try:
-            base_page.swipe(
-                start_x=int(width * 0.1),
-                start_y=int(height * 0.5),
-                end_x=int(width * 0.9),
-                end_y=int(height * 0.5),
-                duration=1000
-            )
-            test_logger.step("Swipe right completed successfully")
-        except Exception as e:
-            test_logger.error(f"Swipe right failed: {str(e)}")
-            soft_assert.assert_true(False, f"Swipe right should work: {str(e)}")
+        start_x, start_y, end_x, end_y = (getattr(screen_anchors, name) for name in SWIPE_VECTORS[direction])
         
-        base_page.wait(1)
-        
-        # Test swipe left
-        test_logger.step("Test swipe left")
+        test_logger.step("Perform swipe %s", direction)
         try:
             base_page.swipe(
-                start_x=int(width * 0.9),
-                start_y=int(height * 0.5),
-                end_x=int(width * 0.1),
-                end_y=int(height * 0.5),
-                duration=1000
+                start_x=start_x,
+                start_y=start_y,
+                end_x=end_x,
+                end_y=end_y,
+                duration=duration
             )
-            test_logger.step("Swipe left completed successfully")
+            test_logger.step("Swipe %s completed successfully", direction)
         except Exception as e:
-            test_logger.error(f"Swipe left failed: {str(e)}")
-            soft_assert.assert_true(False, f"Swipe left should work: {str(e)}")
-        
-        base_page.wait(1)
-        
-        # Test swipe up
-        test_logger.step("Test swipe up")
-        try:
-            base_page.swipe(
-                start_x=int(width * 0.5),
-                start_y=int(height * 0.8),
-                end_x=int(width * 0.5),
-                end_y=int(height * 0.2),
-                duration=1000
-            )
-            test_logger.step("Swipe up completed successfully")
-        except Exception as e:
-            test_logger.error(f"Swipe up failed: {str(e)}")
-            soft_assert.assert_true(False, f"Swipe up should work: {str(e)}")
-        
-        base_page.wait(1)
-        
-        # Test swipe down
-        test_logger.step("Test swipe down")
-        try:
-            base_page.swipe(
-                start_x=int(width * 0.5),
-                start_y=int(height * 0.2),
-                end_x=int(width * 0.5),
-                end_y=int(height * 0.8),
-                duration=1000
-            )
-            test_logger.step("Swipe down completed successfully")
-        except Exception as e:
-            test_logger.error(f"Swipe down failed: {str(e)}")
-            soft_assert.assert_true(False, f"Swipe down should work: {str(e)}")
+            test_logger.error(f"Swipe {direction} failed: {str(e)}")
+            soft_assert.record_failure(f"swipe_{direction}", e)
         
         test_logger.test_end("COMPLETED")
     
-    def test_tap_gestures(self, driver, test_logger, soft_assert):
+    def test_tap_gestures(self, base_page, screen_anchors, test_logger, soft_assert):
         """Test tap gestures at different screen locations."""
         test_logger.test_start("Test tap gestures")
         
-        base_page = BasePage(driver)
-        
-        test_logger.step("Get screen dimensions")
-        screen_size = driver.get_window_size()
-        width = screen_size['width']
-        height = screen_size['height']
-        
-        # Test tap at center
-        test_logger.step("Test tap at screen center")
-        try:
-            base_page.tap(int(width * 0.5), int(height * 0.5))
-            test_logger.step("Center tap completed successfully")
-        except Exception as e:
-            test_logger.error(f"Center tap failed: {str(e)}")
-            soft_assert.assert_true(False, f"Center tap should work: {str(e)}")
-        
-        base_page.wait(1)
-        
-        # Test tap at top-left
-        test_logger.step("Test tap at top-left")
-        try:
-            base_page.tap(int(width * 0.1), int(height * 0.1))
-            test_logger.step("Top-left tap completed successfully")
-        except Exception as e:
-            test_logger.error(f"Top-left tap failed: {str(e)}")
-            soft_assert.assert_true(False, f"Top-left tap should work: {str(e)}")
-        
-        base_page.wait(1)
-        
-        # Test tap at bottom-right
-        test_logger.step("Test tap at bottom-right")
+        # Center, top-left and bottom-right in a single action sequence
+        test_logger.step("Test taps at screen center, top-left and bottom-right")
         try:
-            base_page.tap(int(width * 0.9), int(height * 0.9))
-            test_logger.step("Bottom-right tap completed successfully")
+            base_page.tap_batch([
+                (screen_anchors.cx, screen_anchors.cy),
+                (screen_anchors.left, screen_anchors.top),
+                (screen_anchors.right, screen_anchors.bottom),
+            ])
+            test_logger.step("Taps completed successfully")
         except Exception as e:
-            test_logger.error(f"Bottom-right tap failed: {str(e)}")
-            soft_assert.assert_true(False, f"Bottom-right tap should work: {str(e)}")
+            test_logger.error(f"Taps failed: {str(e)}")
+            soft_assert.record_failure("tap_batch", e)
         
         test_logger.test_end("COMPLETED")
     
-    def test_long_press_gesture(self, driver, test_logger, soft_assert):
+    def test_long_press_gesture(self, base_page, screen_anchors, gesture_duration_ms, test_logger, soft_assert):
         """Test long press gesture."""
         test_logger.test_start("Test long press gesture")
         
-        base_page = BasePage(driver)
-        
-        test_logger.step("Get screen dimensions")
-        screen_size = driver.get_window_size()
-        width = screen_size['width']
-        height = screen_size['height']
-        
         # Test long press at center
         test_logger.step("Test long press at screen center")
         try:
-            base_page.long_press(int(width * 0.5), int(height * 0.5), duration=2000)
+            base_page.long_press_at(screen_anchors.cx, screen_anchors.cy, duration=max(gesture_duration_ms, LONG_PRESS_MIN_MS))
             test_logger.step("Long press completed successfully")
         except Exception as e:
             test_logger.error(f"Long press failed: {str(e)}")
-            soft_assert.assert_true(False, f"Long press should work: {str(e)}")
+            soft_assert.record_failure("long_press", e)
         
         test_logger.test_end("COMPLETED")
     
-    def test_pinch_gesture(self, driver, test_logger, soft_assert):
+    def test_pinch_gesture(self, base_page, screen_anchors, test_logger, soft_assert):
         """Test pinch gesture (zoom in/out)."""
         test_logger.test_start("Test pinch gesture")
         
-        base_page = BasePage(driver)
-        
-        test_logger.step("Get screen dimensions")
-        screen_size = driver.get_window_size()
-        width = screen_size['width']
-        height = screen_size['height']
-        
         # Test pinch (zoom out)
         test_logger.step("Test pinch gesture (zoom out)")
         try:
-            base_page.pinch(
-                x=int(width * 0.5),
-                y=int(height * 0.5),
+            base_page.pinch_at(
+                x=screen_anchors.cx,
+                y=screen_anchors.cy,
                 scale=0.5  # Zoom out
             )
             test_logger.step("Pinch (zoom out) completed successfully")
         except Exception as e:
             test_logger.error(f"Pinch gesture failed: {str(e)}")
-            soft_assert.assert_true(False, f"Pinch gesture should work: {str(e)}")
+            soft_assert.record_failure("pinch_zoom_out", e)
         
-        base_page.wait(2)
+        base_page.wait_for_idle()
         
         # Test pinch (zoom in)
         test_logger.step("Test pinch gesture (zoom in)")
         try:
-            base_page.pinch(
-                x=int(width * 0.5),
-                y=int(height * 0.5),
+            base_page.pinch_at(
+                x=screen_anchors.cx,
+                y=screen_anchors.cy,
                 scale=2.0  # Zoom in
             )
             test_logger.step("Pinch (zoom in) completed successfully")
         except Exception as e:
             test_logger.error(f"Pinch gesture failed: {str(e)}")
-            soft_assert.assert_true(False, f"Pinch gesture should work: {str(e)}")
+            soft_assert.record_failure("pinch_zoom_in", e)
         
         test_logger.test_end("COMPLETED")
     
-    @pytest.mark.parametrize("direction,duration", [
-        ("up", 500),
-        ("down", 500),
-        ("left", 800),
-        ("right", 800),
-        ("up", 1500),
-        ("down", 1500)
-    ])
-    def test_scroll_directions(self, driver, test_logger, soft_assert, direction, duration):
-        """Test scrolling in different directions with various durations."""
-        test_logger.test_start(f"Test scroll {direction} with duration {duration}ms")
-        
-        base_page = BasePage(driver)
-        
-        test_logger.step(f"Perform scroll {direction}")
-        try:
-            if direction == "up":
-                base_page.scroll_up(duration=duration)
-            elif direction == "down":
-                base_page.scroll_down(duration=duration)
-            elif direction == "left":
-                base_page.scroll_left(duration=duration)
-            elif direction == "right":
-                base_page.scroll_right(duration=duration)
-            
-            test_logger.step(f"Scroll {direction} completed successfully")
-        except Exception as e:
-            test_logger.error(f"Scroll {direction} failed: {str(e)}")
-            soft_assert.assert_true(False, f"Scroll {direction} should work: {str(e)}")
-        
-        test_logger.test_end("COMPLETED")
-    
-    def test_keyboard_interactions(self, driver, test_logger, soft_assert):
+    def test_keyboard_interactions(self, base_page, test_logger, soft_assert):
         """Test keyboard show/hide functionality."""
         test_logger.test_start("Test keyboard interactions")
         
-        base_page = BasePage(driver)
-        
         # This test assumes there's a text input field available
         # In a real scenario, you would navigate to a page with input fields
         
@@ -249,70 +145,57 @@ class TestMobileGestures:
         
         test_logger.test_end("COMPLETED")
     
-    def test_device_back_button(self, driver, test_logger, soft_assert):
+    def test_device_back_button(self, base_page, test_logger, soft_assert):
         """Test device back button functionality."""
         test_logger.test_start("Test device back button")
         
-        base_page = BasePage(driver)
-        
         test_logger.step("Test back button functionality")
         try:
             base_page.go_back()
             test_logger.step("Back button pressed successfully")
         except Exception as e:
             test_logger.error(f"Back button failed: {str(e)}")
-            soft_assert.assert_true(False, f"Back button should work: {str(e)}")
+            soft_assert.record_failure("back_button", e)
         
         test_logger.test_end("COMPLETED")
     
-    def test_page_refresh(self, driver, test_logger, soft_assert):
+    def test_page_refresh(self, base_page, test_logger, soft_assert):
         """Test page refresh functionality."""
         test_logger.test_start("Test page refresh")
         
-        base_page = BasePage(driver)
-        
-        test_logger.step("Get page source before refresh")
+        test_logger.step("Check screen content before refresh")
         try:
-            source_before = base_page.get_page_source()
-            soft_assert.assert_is_not_none(source_before, "Page source should be available")
+            soft_assert.assert_true(base_page.has_page_source(), "Page source should be available")
             
             test_logger.step("Refresh page")
             base_page.refresh_page()
             
-            test_logger.step("Wait after refresh")
-            base_page.wait(2)
+            test_logger.step("Wait for screen to settle after refresh")
+            base_page.wait_for_idle()
             
-            test_logger.step("Get page source after refresh")
-            source_after = base_page.get_page_source()
-            soft_assert.assert_is_not_none(source_after, "Page source should be available after refresh")
+            test_logger.step("Check screen content after refresh")
+            soft_assert.assert_true(base_page.has_page_source(), "Page source should be available after refresh")
             
             test_logger.step("Page refresh completed successfully")
             
         except Exception as e:
             test_logger.error(f"Page refresh failed: {str(e)}")
-            soft_assert.assert_true(False, f"Page refresh should work: {str(e)}")
+            soft_assert.record_failure("page_refresh", e)
         
         test_logger.test_end("COMPLETED")
     
     @pytest.mark.android
-    def test_android_specific_gestures(self, driver, test_logger, soft_assert):
+    def test_android_specific_gestures(self, driver, base_page, test_logger, soft_assert):
         """Test Android-specific gesture functionality."""
         test_logger.test_start("Test Android-specific gestures")
         
-        # Verify we're running on Android
-        platform = driver.capabilities.get('platformName', '').lower()
-        if platform != 'android':
-            pytest.skip("This test is for Android platform only")
-        
-        base_page = BasePage(driver)
-        
         test_logger.step("Test Android back button")
         try:
             driver.back()
             test_logger.step("Android back button pressed successfully")
         except Exception as e:
             test_logger.error(f"Android back button failed: {str(e)}")
-            soft_assert.assert_true(False, f"Android back button should work: {str(e)}")
+            soft_assert.record_failure("android_back_button", e)
         
         test_logger.step("Test Android home button")
         try:
@@ -325,55 +208,45 @@ class TestMobileGestures:
         test_logger.test_end("COMPLETED")
     
     @pytest.mark.ios
-    def test_ios_specific_gestures(self, driver, test_logger, soft_assert):
+    def test_ios_specific_gestures(self, base_page, screen_anchors, gesture_duration_ms, test_logger, soft_assert):
         """Test iOS-specific gesture functionality."""
         test_logger.test_start("Test iOS-specific gestures")
         
-        # Verify we're running on iOS
-        platform = driver.capabilities.get('platformName', '').lower()
-        if platform != 'ios':
-            pytest.skip("This test is for iOS platform only")
-        
-        base_page = BasePage(driver)
-        
         test_logger.step("Test iOS-specific swipe gestures")
-        screen_size = driver.get_window_size()
-        width = screen_size['width']
-        height = screen_size['height']
         
         # Test iOS edge swipe (back gesture)
         test_logger.step("Test iOS edge swipe")
         try:
             base_page.swipe(
                 start_x=5,  # Start from left edge
-                start_y=int(height * 0.5),
-                end_x=int(width * 0.5),
-                end_y=int(height * 0.5),
-                duration=500
+                start_y=screen_anchors.cy,
+                end_x=screen_anchors.cx,
+                end_y=screen_anchors.cy,
+                duration=gesture_duration_ms
             )
             test_logger.step("iOS edge swipe completed successfully")
         except Exception as e:
             test_logger.error(f"iOS edge swipe failed: {str(e)}")
-            soft_assert.assert_true(False, f"iOS edge swipe should work: {str(e)}")
+            soft_assert.record_failure("ios_edge_swipe", e)
         
         test_logger.test_end("COMPLETED")
     
-    def test_screenshot_functionality(self, driver, test_logger, soft_assert):
+    def test_screenshot_functionality(self, base_page, test_logger, soft_assert):
         """Test screenshot capture functionality."""
         test_logger.test_start("Test screenshot functionality")
         
-        base_page = BasePage(driver)
-        
         test_logger.step("Take screenshot")
         try:
             screenshot_path = base_page.take_screenshot("gesture_test_screenshot.png")
             soft_assert.assert_is_not_none(screenshot_path, "Screenshot path should be returned")
             
+            # The file is written in the background; a write failure is re-raised here
+            base_page.wait_for_screenshots(timeout=10)
             test_logger.screenshot(screenshot_path, "Gesture test screenshot")
             test_logger.step("Screenshot taken successfully")
             
         except Exception as e:
             test_logger.error(f"Screenshot failed: {str(e)}")
-            soft_assert.assert_true(False, f"Screenshot should work: {str(e)}")
+            soft_assert.record_failure("screenshot", e)
         
         test_logger.test_end("COMPLETED")
\ No newline at end of file
@@ -3,61 +3,53 @@ Login Test Cases - Example implementation demonstrating framework usage
 Shows how to use page objects, soft assertions, fixtures, and logging.
 """
 
+import time
+
 import pytest
-from pages.login_page import LoginPage
 
 
 class TestLogin:
     """Test class for login functionality."""
     
-    def test_login_page_elements_visibility(self, driver, test_logger, soft_assert):
+    def test_login_page_elements_visibility(self, login_page, test_logger, soft_assert):
         """Test that all login page elements are visible."""
         test_logger.test_start("Verify login page elements visibility")
         
-        # Create page object
-        login_page = LoginPage(driver)
-        
         test_logger.step("Navigate to login page and verify it's loaded")
         page_loaded = login_page.is_page_loaded()
         soft_assert.assert_true(page_loaded, "Login page should be loaded")
         
         if page_loaded:
+            # Visibility and enabled state of the whole form from one page source dump
+            form = login_page.snapshot_elements()
+            
             test_logger.step("Verify username field is visible")
-            username_visible = login_page.is_element_visible(login_page.USERNAME_FIELD)
-            soft_assert.assert_true(username_visible, "Username field should be visible")
+            soft_assert.assert_true(form[login_page.USERNAME_FIELD[1]]['displayed'], "Username field should be visible")
             
             test_logger.step("Verify password field is visible")
-            password_visible = login_page.is_element_visible(login_page.PASSWORD_FIELD)
-            soft_assert.assert_true(password_visible, "Password field should be visible")
+            soft_assert.assert_true(form[login_page.PASSWORD_FIELD[1]]['displayed'], "Password field should be visible")
             
             test_logger.step("Verify login button is visible")
-            login_button_visible = login_page.is_element_visible(login_page.LOGIN_BUTTON)
-            soft_assert.assert_true(login_button_visible, "Login button should be visible")
+            soft_assert.assert_true(form[login_page.LOGIN_BUTTON[1]]['displayed'], "Login button should be visible")
             
             test_logger.step("Verify login button is enabled")
-            login_button_enabled = login_page.is_login_button_enabled()
-            soft_assert.assert_true(login_button_enabled, "Login button should be enabled")
+            soft_assert.assert_true(form[login_page.LOGIN_BUTTON[1]]['enabled'], "Login button should be enabled")
         
         test_logger.test_end("COMPLETED")
     
-    def test_valid_login(self, driver, test_logger, soft_assert, test_data):
+    def test_valid_login(self, login_page, test_logger, soft_assert, valid_credentials):
         """Test login with valid credentials."""
         test_logger.test_start("Test login with valid credentials")
         
-        # Create page object
-        login_page = LoginPage(driver)
-        
         test_logger.step("Verify login page is loaded")
         page_loaded = login_page.is_page_loaded()
         soft_assert.assert_true(page_loaded, "Login page should be loaded")
         
         if page_loaded:
-            # Get valid credentials from test data
-            credentials = test_data['valid_credentials']
-            username = credentials['username']
-            password = credentials['password']
+            username = valid_credentials['username']
+            password = valid_credentials['password']
             
-            test_logger.step(f"Enter username: {username}")
+            test_logger.step("Enter username: %s", username)
             login_page.enter_username(username)
             
             # Verify username was entered
@@ -77,32 +69,22 @@ class TestLogin:
             test_logger.step("Verify login success")
             login_successful = login_page.is_login_successful()
             soft_assert.assert_true(login_successful, "Login should be successful with valid credentials")
-            
-            if not login_successful:
-                # Take screenshot on failure
-                screenshot_path = login_page.take_login_page_screenshot("valid_login_failure.png")
-                test_logger.screenshot(screenshot_path, "Login failure with valid credentials")
         
         test_logger.test_end("COMPLETED")
     
-    def test_invalid_login(self, driver, test_logger, soft_assert, test_data):
+    def test_invalid_login(self, login_page, test_logger, soft_assert, invalid_credentials):
         """Test login with invalid credentials."""
         test_logger.test_start("Test login with invalid credentials")
         
-        # Create page object
-        login_page = LoginPage(driver)
-        
         test_logger.step("Verify login page is loaded")
         page_loaded = login_page.is_page_loaded()
         soft_assert.assert_true(page_loaded, "Login page should be loaded")
         
         if page_loaded:
-            # Get invalid credentials from test data
-            credentials = test_data['invalid_credentials']
-            username = credentials['username']
-            password = credentials['password']
+            username = invalid_credentials['username']
+            password = invalid_credentials['password']
             
-            test_logger.step(f"Perform login with invalid credentials: {username}")
+            test_logger.step("Perform login with invalid credentials: %s", username)
             login_page.login(username, password)
             
             test_logger.step("Wait for login process to complete")
@@ -114,7 +96,7 @@ class TestLogin:
             
             if error_displayed:
                 error_message = login_page.get_error_message()
-                test_logger.step(f"Error message: {error_message}")
+                test_logger.step("Error message: %s", error_message)
                 soft_assert.assert_not_empty(error_message, "Error message should not be empty")
                 soft_assert.assert_contains(error_message.lower(), "invalid", "Error message should indicate invalid credentials")
             
@@ -124,6 +106,7 @@ class TestLogin:
         
         test_logger.test_end("COMPLETED")
     
+    @pytest.mark.xdist_group(name="login")
     @pytest.mark.parametrize("username,password,expected_result", [
         ("", "", "empty_credentials"),
         ("valid@email.com", "", "empty_password"),
@@ -131,23 +114,20 @@ class TestLogin:
         ("invalid_email", "password123", "invalid_email_format"),
         ("test@email.com", "short", "short_password")
     ])
-    def test_login_validation(self, driver, test_logger, soft_assert, username, password, expected_result):
+    def test_login_validation(self, login_page, test_logger, soft_assert, username, password, expected_result):
         """Test login validation with various input combinations."""
         test_logger.test_start(f"Test login validation: {expected_result}")
         
-        # Create page object
-        login_page = LoginPage(driver)
-        
         test_logger.step("Verify login page is loaded")
         page_loaded = login_page.is_page_loaded()
         soft_assert.assert_true(page_loaded, "Login page should be loaded")
         
         if page_loaded:
-            test_logger.step(f"Clear existing field values")
+            test_logger.step("Clear existing field values")
             login_page.clear_username_field()
             login_page.clear_password_field()
             
-            test_logger.step(f"Enter credentials - Username: '{username}', Password: '[HIDDEN]'")
+            test_logger.step("Enter credentials - Username: '%s', Password: '[HIDDEN]'", username)
             if username:
                 login_page.enter_username(username)
             if password:
@@ -177,22 +157,20 @@ class TestLogin:
         test_logger.test_end("COMPLETED")
     
     @pytest.mark.smoke
-    def test_login_page_load_performance(self, driver, test_logger, soft_assert):
+    def test_login_page_load_performance(self, login_page, test_logger, soft_assert):
         """Test login page load performance."""
         test_logger.test_start("Test login page load performance")
         
-        import time
-        
-        start_time = time.time()
-        
-        # Create page object
-        login_page = LoginPage(driver)
+        start_time = time.perf_counter()
         
         test_logger.step("Measure page load time")
         page_loaded = login_page.is_page_loaded(timeout=15)
         
-        load_time = time.time() - start_time
-        test_logger.step(f"Page load time: {load_time:.2f} seconds")
+        # Prefer the device-reported launch time; it excludes WebDriver round-trips
+        device_time = login_page.get_displayed_time(login_page.driver.capabilities.get('appPackage'))
+        load_time = device_time if device_time is not None else time.perf_counter() - start_time
+        source = "device-reported" if device_time is not None else "wall clock"
+        test_logger.step("Page load time: %.2f seconds (%s)", load_time, source)
         
         soft_assert.assert_true(page_loaded, "Login page should load successfully")
         soft_assert.assert_less(load_time, 10.0, "Page should load within 10 seconds")
@@ -203,17 +181,10 @@ class TestLogin:
         test_logger.test_end("COMPLETED")
     
     @pytest.mark.android
-    def test_android_specific_login(self, driver, test_logger, soft_assert):
+    def test_android_specific_login(self, login_page, test_logger, soft_assert):
         """Test Android-specific login functionality."""
         test_logger.test_start("Test Android-specific login functionality")
         
-        # Verify we're running on Android
-        platform = driver.capabilities.get('platformName', '').lower()
-        if platform != 'android':
-            pytest.skip("This test is for Android platform only")
-        
-        login_page = LoginPage(driver)
-        
         test_logger.step("Test Android back button behavior")
         # Test back button functionality if applicable
         login_page.go_back()
@@ -225,17 +196,10 @@ class TestLogin:
         test_logger.test_end("COMPLETED")
     
     @pytest.mark.ios
-    def test_ios_specific_login(self, driver, test_logger, soft_assert):
+    def test_ios_specific_login(self, login_page, test_logger, soft_assert):
         """Test iOS-specific login functionality."""
         test_logger.test_start("Test iOS-specific login functionality")
         
-        # Verify we're running on iOS
-        platform = driver.capabilities.get('platformName', '').lower()
-        if platform != 'ios':
-            pytest.skip("This test is for iOS platform only")
-        
-        login_page = LoginPage(driver)
-        
         test_logger.step("Verify iOS-specific elements")
         page_loaded = login_page.is_page_loaded()
         soft_assert.assert_true(page_loaded, "Login page should load on iOS")
@@ -247,12 +211,10 @@ class TestLogin:
         
         test_logger.test_end("COMPLETED")
     
-    def test_login_accessibility(self, driver, test_logger, soft_assert):
+    def test_login_accessibility(self, login_page, test_logger, soft_assert):
         """Test login page accessibility features."""
         test_logger.test_start("Test login page accessibility")
         
-        login_page = LoginPage(driver)
-        
         test_logger.step("Verify page is loaded")
         page_loaded = login_page.is_page_loaded()
         soft_assert.assert_true(page_loaded, "Login page should be loaded")
@@ -260,22 +222,11 @@ class TestLogin:
         if page_loaded:
             test_logger.step("Check accessibility attributes")
             
-            # Check if elements have accessibility labels/descriptions
-            username_element = login_page.find_element(login_page.USERNAME_FIELD)
-            password_element = login_page.find_element(login_page.PASSWORD_FIELD)
-            login_button_element = login_page.find_element(login_page.LOGIN_BUTTON)
-            
-            # Check for accessibility attributes (platform-specific)
-            platform = driver.capabilities.get('platformName', '').lower()
-            
-            if platform == 'android':
-                username_desc = username_element.get_attribute('content-desc')
-                password_desc = password_element.get_attribute('content-desc')
-                button_desc = login_button_element.get_attribute('content-desc')
-            else:  # iOS
-                username_desc = username_element.get_attribute('name')
-                password_desc = password_element.get_attribute('name')
-                button_desc = login_button_element.get_attribute('name')
+            # Accessibility labels (content-desc / name) for the whole form from one page source dump
+            descriptions = login_page.get_accessibility_descriptions()
+            username_desc = descriptions[login_page.USERNAME_FIELD[1]]
+            password_desc = descriptions[login_page.PASSWORD_FIELD[1]]
+            button_desc = descriptions[login_page.LOGIN_BUTTON[1]]
             
             soft_assert.assert_is_not_none(username_desc, "Username field should have accessibility description")
             soft_assert.assert_is_not_none(password_desc, "Password field should have accessibility description")
@@ -2,36 +2,60 @@
 Text verification utilities for mobile app testing
 """
 
+import re
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+
+from selenium.common.exceptions import TimeoutException
 from appium.webdriver.common.appiumby import AppiumBy
+from config.device_config import WAIT_CONFIG
 from tests.utils.wait_utils import WaitUtils
 
 
+# Node tag/class of Android text views in UiAutomator2 page source
+TEXT_VIEW_CLASS = "android.widget.TextView"
+
+# Context name of the native app; every other context is a webview
+NATIVE_CONTEXT = "NATIVE_APP"
+
+# Words of an expected text longer than this count as a partial match on their own
+MIN_MATCH_WORD_LENGTH = 3
+
+# Length of the substrings check_all_texts indexes screen texts by; must not
+# exceed the shortest significant word
+SHINGLE_SIZE = MIN_MATCH_WORD_LENGTH + 1
+
+
+def extract_texts(page_source):
+    """Return the non-empty text of every TextView in a page source snapshot"""
+    root = ET.fromstring(page_source)
+    texts = []
+    for node in root.iter():
+        if node.tag == TEXT_VIEW_CLASS or node.get("class") == TEXT_VIEW_CLASS:
+            text = (node.get("text") or "").strip()
+            if text:
+                texts.append(text)
+    return texts
+
+
 def get_text_elements(driver):
     """Get all text elements from the app using proper waits"""
     print("🔍 Starting text extraction...")
     
     # Use WaitUtils for proper waiting
-    wait_utils = WaitUtils(driver)
+    wait_utils = WaitUtils.for_driver(driver)
     
     # Wait for app to be ready
     print("⏳ Waiting for app to be ready...")
     wait_utils.wait_for_app_ready()
     
-    # Wait for text elements to be loaded
+    # Poll page source until text has rendered; each poll is a single request
+    # instead of one per element attribute
     print("⏳ Waiting for text elements to load...")
-    text_elements = wait_utils.wait_for_text_elements()
-    
-    print(f"📱 Found {len(text_elements)} TextView elements")
-    
-    # Extract all text content
-    all_texts = []
-    for element in text_elements:
-        try:
-            text_content = element.text.strip()
-            if text_content:  # Only add non-empty text
-                all_texts.append(text_content)
-        except Exception as e:
-            print(f"⚠️ Error extracting text: {e}")
+    try:
+        all_texts = wait_utils.wait.until(lambda d: extract_texts(d.page_source))
+    except TimeoutException:
+        raise Exception(f"Text elements not loaded within {WAIT_CONFIG['explicit_wait']} seconds")
     
     print(f"📝 Extracted {len(all_texts)} text elements:")
     for i, text in enumerate(all_texts, 1):
@@ -40,33 +64,121 @@ def get_text_elements(driver):
     return all_texts
 
 
+def _significant_words(expected):
+    """Words of a lowercased expected text long enough to match on their own"""
+    return [word for word in expected.split() if len(word) > MIN_MATCH_WORD_LENGTH]
+
+
+def _compile_expected(expected, words):
+    """Build one regex matching the expected text or any of its significant words"""
+    # A text containing the whole expected text also contains each of its words
+    return re.compile("|".join(re.escape(term) for term in (words or [expected])))
+
+
+def _find_match(expected_text, actual_texts, lowered_texts, candidates=None):
+    """
+    Return the first actual text matching expected_text, or None
+    
+    Args:
+        candidates: Ascending indices of the only actual texts that can match; all if None
+    """
+    expected = expected_text.lower()
+    pattern = _compile_expected(expected, _significant_words(expected))
+    if candidates is None:
+        candidates = range(len(actual_texts))
+    for i in candidates:
+        lowered = lowered_texts[i]
+        if pattern.search(lowered) or lowered in expected:
+            return actual_texts[i]
+    return None
+
+
 def check_text_match(expected_text, actual_texts):
     """Check if expected text matches any of the actual texts"""
-    for actual_text in actual_texts:
-        # More flexible matching - check if key parts of the text match
-        if (expected_text.lower() in actual_text.lower() or 
-            actual_text.lower() in expected_text.lower() or
-            any(word in actual_text.lower() for word in expected_text.lower().split() if len(word) > 3)):
-            return True, actual_text
-    return False, ""
+    matched_text = _find_match(expected_text, actual_texts, [text.lower() for text in actual_texts])
+    return matched_text is not None, matched_text or ""
+
+
+def _shingles(text):
+    """All SHINGLE_SIZE-character substrings of text"""
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+class _ShingleIndex:
+    """Lowercased screen texts indexed by the shingles they contain and start with"""
+    
+    def __init__(self, lowered_texts):
+        self.containing = defaultdict(list)
+        self.starting = defaultdict(list)
+        self.short = []
+        for i, lowered in enumerate(lowered_texts):
+            if len(lowered) < SHINGLE_SIZE:
+                self.short.append(i)
+                continue
+            self.starting[lowered[:SHINGLE_SIZE]].append(i)
+            for shingle in _shingles(lowered):
+                self.containing[shingle].append(i)
+    
+    def candidates(self, expected):
+        """
+        Ascending indices of the texts that could match a lowercased expected text, or None for all
+        
+        A match needs the text to contain a significant word, or the whole
+        expected text, and so that word's first shingle; or to be contained in
+        the expected text, so its first shingle is one of the expected's.
+        Texts shorter than a shingle are always candidates.
+        """
+        heads = [word[:SHINGLE_SIZE] for word in _significant_words(expected)]
+        if not heads:
+            if len(expected) < SHINGLE_SIZE:
+                return None
+            heads = [expected[:SHINGLE_SIZE]]
+        
+        candidates = set(self.short)
+        for head in heads:
+            candidates.update(self.containing.get(head, ()))
+        for shingle in _shingles(expected):
+            candidates.update(self.starting.get(shingle, ()))
+        return sorted(candidates)
+
+
+def check_all_texts(expected_texts, actual_texts):
+    """
+    Check several expected texts against the same screen texts
+    
+    The screen texts are lowercased and shingle-indexed once, so each check
+    only scans the texts that share a shingle with it.
+    
+    Returns:
+        dict: expected text -> (found, matched text), as from check_text_match
+    """
+    lowered_texts = [text.lower() for text in actual_texts]
+    index = _ShingleIndex(lowered_texts)
+    results = {}
+    for expected_text in expected_texts:
+        candidates = index.candidates(expected_text.lower())
+        matched_text = _find_match(expected_text, actual_texts, lowered_texts, candidates)
+        results[expected_text] = (matched_text is not None, matched_text or "")
+    return results
 
 
 def verify_webview_context(driver):
     """Check if the app uses WebView and switch context if needed"""
     print("🔍 Checking for WebView...")
     
-    # Check for WebView elements
+    # Check for WebView elements; this native class query is much cheaper than
+    # listing contexts, so contexts are only fetched when a WebView exists
     webview_elements = driver.find_elements(by=AppiumBy.CLASS_NAME, value='android.webkit.WebView')
     print(f"📱 Found {len(webview_elements)} WebView elements")
     
     if len(webview_elements) > 0:
         print("🌐 App uses WebView - checking contexts...")
-        contexts = driver.contexts
-        print(f"📋 Available contexts: {contexts}")
+        # Switch straight to the first webview context rather than assuming its position
+        webview_context = next((context for context in driver.contexts if context != NATIVE_CONTEXT), None)
         
-        if len(contexts) > 1:
-            print("🔄 Switching to WebView context...")
-            driver.switch_to.context(contexts[1])
+        if webview_context:
+            print(f"🔄 Switching to WebView context {webview_context}...")
+            driver.switch_to.context(webview_context)
             print("✅ Switched to WebView context")
             return True
         else:
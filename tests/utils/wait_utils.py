@@ -6,18 +6,56 @@ Professional wait strategies for mobile app testing
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from appium.webdriver.common.appiumby import AppiumBy
-from config.device_config import WAIT_CONFIG
-import time
+from config.device_config import APP_CONFIG, WAIT_CONFIG
+
+
+# Seconds between readiness polls; short so a wait returns soon after the app is ready
+READY_POLL_INTERVAL = 0.1
+
+# Matches any on-screen node of the app under test; a native query that needs
+# no page source dump, unlike XPath
+APP_READY_LOCATOR = (
+    AppiumBy.ANDROID_UIAUTOMATOR,
+    f'new UiSelector().packageName("{APP_CONFIG["package_name"]}")'
+)
+
+# TextViews with non-blank text; the server filters, so no per-element .text reads
+LOADED_TEXT_LOCATOR = (
+    AppiumBy.ANDROID_UIAUTOMATOR,
+    'new UiSelector().className("android.widget.TextView").textMatches("(?s).*[^ ].*")'
+)
+
+# Session ids of drivers whose app has already been seen ready; cleared for a
+# session when its app is relaunched or the driver is released
+_ready_sessions = set()
+
+
+def reset_app_ready(driver):
+    """Forget that the driver's app was ready, e.g. after relaunching it"""
+    _ready_sessions.discard(driver.session_id)
 
 
 class WaitUtils:
     """Utility class for handling waits in mobile app testing"""
     
+    # One instance per driver session, handed out by for_driver() and dropped
+    # by release_driver() when the session ends
+    _instances = {}
+    
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, WAIT_CONFIG["explicit_wait"])
     
+    @classmethod
+    def for_driver(cls, driver):
+        """Return the shared WaitUtils for this driver, creating it on first use"""
+        instance = cls._instances.get(driver.session_id)
+        if instance is None or instance.driver is not driver:
+            instance = cls._instances[driver.session_id] = cls(driver)
+        return instance
+    
     def wait_for_element_present(self, locator, timeout=None):
         """Wait for element to be present"""
         if timeout:
@@ -85,26 +123,25 @@ class WaitUtils:
     
     def wait_for_app_ready(self, timeout=None):
         """Wait for app to be ready (custom implementation)"""
+        # Readiness only needs confirming once per launch of the app in a session
+        if self.driver.session_id in _ready_sessions:
+            return True
+        
         if timeout:
             wait_time = timeout
         else:
             wait_time = WAIT_CONFIG["explicit_wait"]
         
-        start_time = time.time()
-        
-        while time.time() - start_time < wait_time:
-            try:
-                # Check if app has loaded by looking for common elements
-                elements = self.driver.find_elements(AppiumBy.XPATH, "//*")
-                if len(elements) > 0:
-                    print("✅ App is ready")
-                    return True
-            except Exception:
-                pass
-            
-            time.sleep(0.5)  # Short sleep to avoid busy waiting
-        
-        raise Exception(f"App not ready within {wait_time} seconds")
+        try:
+            # App has loaded once any of its elements is on screen; only the first match is fetched
+            WebDriverWait(self.driver, wait_time, poll_frequency=READY_POLL_INTERVAL).until(
+                EC.presence_of_element_located(APP_READY_LOCATOR)
+            )
+            _ready_sessions.add(self.driver.session_id)
+            print("✅ App is ready")
+            return True
+        except TimeoutException:
+            raise Exception(f"App not ready within {wait_time} seconds")
     
     def wait_for_text_elements(self, timeout=None):
         """Wait for text elements to be present and loaded"""
@@ -113,24 +150,18 @@ class WaitUtils:
         else:
             wait_time = WAIT_CONFIG["text_extraction_timeout"]
         
-        start_time = time.time()
-        
-        while time.time() - start_time < wait_time:
-            try:
-                # Wait for TextView elements to be present
-                text_elements = self.driver.find_elements(
-                    AppiumBy.CLASS_NAME, "android.widget.TextView"
-                )
-                
-                if text_elements:
-                    # Check if elements have text content
-                    for element in text_elements:
-                        if element.text and element.text.strip():
-                            print("✅ Text elements are loaded")
-                            return text_elements
-            except Exception:
-                pass
-            
-            time.sleep(0.5)  # Short sleep to avoid busy waiting
-        
-        raise Exception(f"Text elements not loaded within {wait_time} seconds")
+        try:
+            # Only TextViews that already have text content are returned
+            text_elements = WebDriverWait(self.driver, wait_time, poll_frequency=READY_POLL_INTERVAL).until(
+                lambda driver: driver.find_elements(*LOADED_TEXT_LOCATOR)
+            )
+            print("✅ Text elements are loaded")
+            return text_elements
+        except TimeoutException:
+            raise Exception(f"Text elements not loaded within {wait_time} seconds")
+
+
+def release_driver(driver):
+    """Drop the shared WaitUtils and readiness state of a driver whose session is ending"""
+    WaitUtils._instances.pop(driver.session_id, None)
+    _ready_sessions.discard(driver.session_id)
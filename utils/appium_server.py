@@ -5,17 +5,30 @@ Provides functionality to start, stop, and manage Appium server instances.
 
 import os
 import time
+import collections
 import signal
+import socket
 import subprocess
 import threading
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from config.config_manager import config_manager
 from utils.logger import get_logger
 
 
+# Seconds a server stopped by PID gets to exit after SIGTERM before it is killed
+TERMINATE_GRACE_PERIOD = 5
+
+# Seconds between startup probes; each attempt is a cheap TCP connect until the port opens
+STARTUP_POLL_INTERVAL = 0.25
+
+# Most recent server output lines kept in memory when no log file is given
+LOG_BUFFER_LINES = 10000
+
+
 class AppiumServer:
     """Appium server management class with thread-safe operations."""
     
@@ -31,11 +44,41 @@ class AppiumServer:
         self.port = self.server_config['port']
         self.server_url = f"http://{self.host}:{self.port}"
         self.status_url = f"{self.server_url}/wd/hub/status"
+        
+        # Status probes reuse one keep-alive connection instead of reconnecting each time
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        
+        # Set once the test session has confirmed the server is up
+        self._session_confirmed = False
+        
+        # Log file given to the running server, if any; otherwise output is
+        # drained from a pipe into a bounded buffer
+        self._log_file: Optional[str] = None
+        self._log_buffer = collections.deque(maxlen=LOG_BUFFER_LINES)
+        
+        # PID of the server we started, so a later run can stop exactly that process
+        self.pid_file = os.path.join(os.path.expanduser("~"), f".appium_server_{self.port}.pid")
     
-    def is_server_running(self) -> bool:
-        """Check if Appium server is running."""
+    def mark_session_confirmed(self) -> None:
+        """Record that the server is up so later checks skip the status request."""
+        self._session_confirmed = True
+    
+    def is_server_running(self, refresh: bool = False) -> bool:
+        """
+        Check if Appium server is running.
+        
+        Args:
+            refresh: Query the status endpoint even if the session already confirmed the server
+            
+        Returns:
+            bool: True if server is running, False otherwise
+        """
+        if self._session_confirmed and not refresh:
+            return True
+        
         try:
-            response = requests.get(self.status_url, timeout=5)
+            response = self._http.get(self.status_url, timeout=5)
             if response.status_code == 200:
                 self.logger.debug("Appium server is running")
                 return True
@@ -71,13 +114,32 @@ class AppiumServer:
                 
                 self.logger.info(f"Starting Appium server: {' '.join(cmd)}")
                 
-                # Start server process
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
+                # Start server process. With a log file, --log writes it and the
+                # console output is discarded; otherwise a daemon thread drains the
+                # output so a full pipe buffer can never stall the server
+                self._log_file = log_file
+                self._log_buffer.clear()
+                if log_file:
+                    self.process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
+                    )
+                else:
+                    self.process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        universal_newlines=True,
+                        bufsize=1
+                    )
+                    threading.Thread(
+                        target=self._drain_output,
+                        args=(self.process.stdout,),
+                        name="appium-output",
+                        daemon=True
+                    ).start()
+                self._write_pid_file(self.process.pid)
                 
                 # Wait for server to start
                 if self._wait_for_server_start(timeout):
@@ -100,6 +162,7 @@ class AppiumServer:
             bool: True if server stopped successfully, False otherwise
         """
         with self.lock:
+            self._session_confirmed = False
             try:
                 if self.process:
                     self.logger.info("Stopping Appium server...")
@@ -116,10 +179,11 @@ class AppiumServer:
                         self.process.wait()
                     
                     self.process = None
+                    self._remove_pid_file()
                     self.logger.info("Appium server stopped successfully")
                     return True
                 
-                # Try to kill any running Appium processes
+                # Stop a server started by an earlier run, if it left a PID file
                 self._kill_appium_processes()
                 return True
                 
@@ -153,23 +217,37 @@ class AppiumServer:
         
         return self.start_server(log_file, additional_args, timeout)
     
-    def get_server_logs(self) -> Optional[str]:
+    def get_server_logs(self, max_bytes: int = 65536) -> Optional[str]:
         """
-        Get server logs if process is running.
+        Get the most recent server output.
         
+        Args:
+            max_bytes: Maximum number of bytes to read from the end of the log file
+            
         Returns:
             str: Server logs or None if not available
         """
-        if self.process and self.process.stdout:
+        if not self._log_file:
+            return "".join(self._log_buffer) if self._log_buffer else None
+        
+        if os.path.exists(self._log_file):
             try:
-                # Read available output without blocking
-                output = self.process.stdout.read()
-                return output
+                with open(self._log_file, 'rb') as log:
+                    log.seek(max(0, os.path.getsize(self._log_file) - max_bytes))
+                    return log.read().decode('utf-8', errors='replace')
             except Exception as e:
                 self.logger.error(f"Failed to read server logs: {str(e)}")
         
         return None
     
+    def _drain_output(self, stream) -> None:
+        """Read server output until the process closes it, keeping the latest lines."""
+        try:
+            for line in stream:
+                self._log_buffer.append(line)
+        except (OSError, ValueError):
+            pass
+    
     def _build_server_command(self, 
                              log_file: Optional[str] = None,
                              additional_args: Optional[Dict[str, Any]] = None) -> list:
@@ -194,12 +272,21 @@ class AppiumServer:
         
         return cmd
     
+    def _is_port_open(self) -> bool:
+        """Check whether the server port accepts TCP connections."""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=0.2):
+                return True
+        except OSError:
+            return False
+    
     def _wait_for_server_start(self, timeout: int) -> bool:
         """Wait for server to start and become responsive."""
         start_time = time.time()
         
         while time.time() - start_time < timeout:
-            if self.is_server_running():
+            # Only query /status once the port is open
+            if self._is_port_open() and self.is_server_running(refresh=True):
                 return True
             
             # Check if process is still running
@@ -207,12 +294,114 @@ class AppiumServer:
                 self.logger.error("Appium server process terminated unexpectedly")
                 return False
             
-            time.sleep(1)
+            time.sleep(STARTUP_POLL_INTERVAL)
         
         return False
     
-    def _kill_appium_processes(self) -> None:
-        """Kill any running Appium processes."""
+    def _write_pid_file(self, pid: int) -> None:
+        """Record the PID of the started server."""
+        try:
+            with open(self.pid_file, 'w') as f:
+                f.write(str(pid))
+        except OSError as e:
+            self.logger.warning(f"Failed to write PID file {self.pid_file}: {str(e)}")
+    
+    def _remove_pid_file(self) -> None:
+        """Remove the PID file, if present."""
+        try:
+            os.remove(self.pid_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to remove PID file {self.pid_file}: {str(e)}")
+    
+    def _wait_for_exit(self, pid: int) -> None:
+        """Wait for a terminated process to exit, killing it after the grace period."""
+        deadline = time.time() + TERMINATE_GRACE_PERIOD
+        try:
+            while time.time() < deadline:
+                os.kill(pid, 0)
+                time.sleep(0.1)
+            self.logger.warning(f"Appium server process {pid} didn't terminate gracefully, forcing kill")
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
+    def _taskkill(self, pid: int) -> None:
+        """Stop a Windows process with taskkill, forcing it if it ignores the close request."""
+        result = subprocess.run(['taskkill', '/PID', str(pid)], capture_output=True, check=False)
+        if result.returncode != 0:
+            self.logger.warning(f"Appium server process {pid} didn't terminate gracefully, forcing kill")
+            result = subprocess.run(['taskkill', '/F', '/PID', str(pid)], capture_output=True, text=True, check=False)
+            if result.returncode != 0:
+                raise OSError(result.stderr.strip() or f"taskkill failed for PID {pid}")
+    
+    def _is_appium_process(self, pid: int) -> bool:
+        """
+        Check that a PID belongs to a running Appium server.
+        
+        Returns:
+            bool: True only if the process command line (the image name on
+            Windows) mentions appium or node; False when it cannot be read
+        """
+        if os.name == 'nt':
+            # tasklist has no command line column; Appium runs as node.exe or appium.exe
+            result = subprocess.run(['tasklist', '/FI', f'PID eq {pid}', '/FO', 'CSV', '/NH'],
+                                    capture_output=True, text=True, check=False)
+            image = result.stdout.split(',', 1)[0].strip().strip('"').lower()
+            return image.startswith(('node', 'appium'))
+        
+        try:
+            with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                command = f.read().decode(errors='replace')
+        except FileNotFoundError:
+            if os.path.isdir("/proc"):
+                return False
+            # No procfs (e.g. macOS); ask ps for the command line instead
+            result = subprocess.run(['ps', '-p', str(pid), '-o', 'command='],
+                                    capture_output=True, text=True, check=False)
+            command = result.stdout
+        except OSError:
+            return False
+        
+        return 'appium' in command.lower()
+    
+    def _kill_appium_processes(self, force: bool = False) -> None:
+        """
+        Stop the Appium server recorded in the PID file.
+        
+        Args:
+            force: Also kill every Appium process on the host (every node.exe on Windows)
+        """
+        try:
+            with open(self.pid_file) as f:
+                pid = int(f.read().strip())
+        except (OSError, ValueError):
+            pid = None
+        
+        if pid is not None and not self._is_appium_process(pid):
+            # Stale file: the PID may since have been reused by an unrelated process
+            self.logger.info(f"PID {pid} from {self.pid_file} is not an Appium server; leaving it alone")
+            self._remove_pid_file()
+            pid = None
+        
+        if pid is not None:
+            try:
+                if os.name == 'nt':  # Windows
+                    self._taskkill(pid)
+                else:
+                    os.kill(pid, signal.SIGTERM)
+                    self._wait_for_exit(pid)
+                self.logger.info(f"Stopped Appium server process {pid}")
+            except ProcessLookupError:
+                self.logger.info(f"Appium server process {pid} was not running")
+            except OSError as e:
+                self.logger.warning(f"Failed to stop Appium server process {pid}: {str(e)}")
+            self._remove_pid_file()
+        
+        if not force:
+            return
+        
         try:
             if os.name == 'nt':  # Windows
                 subprocess.run(['taskkill', '/f', '/im', 'node.exe'], 
@@ -265,27 +454,32 @@ class AppiumServerManager:
         return cls.get_instance().restart_server(**kwargs)
     
     @classmethod
-    def is_server_running(cls) -> bool:
+    def is_server_running(cls, refresh: bool = False) -> bool:
         """Check if server is running using singleton instance."""
-        return cls.get_instance().is_server_running()
+        return cls.get_instance().is_server_running(refresh=refresh)
 
 
 # Convenience functions
+def _server() -> AppiumServer:
+    """Get the singleton server, reading it directly once it exists."""
+    return AppiumServerManager._instance or AppiumServerManager.get_instance()
+
+
 def start_appium_server(**kwargs) -> bool:
     """Start Appium server with optional arguments."""
-    return AppiumServerManager.start_server(**kwargs)
+    return _server().start_server(**kwargs)
 
 
 def stop_appium_server() -> bool:
     """Stop Appium server."""
-    return AppiumServerManager.stop_server()
+    return _server().stop_server()
 
 
 def restart_appium_server(**kwargs) -> bool:
     """Restart Appium server with optional arguments."""
-    return AppiumServerManager.restart_server(**kwargs)
+    return _server().restart_server(**kwargs)
 
 
 def is_appium_server_running() -> bool:
     """Check if Appium server is running."""
-    return AppiumServerManager.is_server_running()
\ No newline at end of file
+    return _server().is_server_running()
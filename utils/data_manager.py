@@ -26,7 +26,10 @@ from dataclasses import dataclass
 from datetime import datetime
 
 # Import configuration manager
-from utils.config_manager import ConfigManager
+from config.config_manager import get_config_manager
+
+# libyaml-backed loader parses several times faster; fall back to pure Python
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass
@@ -63,7 +66,7 @@ class DataManager:
         Args:
             data_directory: Path to test data directory
         """
-        self.config = ConfigManager()
+        self.config = get_config_manager()
         self.logger = logging.getLogger(__name__)
         
         # Set data directory
@@ -80,6 +83,9 @@ class DataManager:
         # Data cache
         self._cache: Dict[str, DataSource] = {}
         
+        # user_type -> (source user list, {id: user}); rebuilt when the list is reloaded
+        self._user_index: Dict[str, tuple] = {}
+        
         # Supported formats
         self._supported_formats = {
             '.json': self._load_json,
@@ -134,7 +140,7 @@ class DataManager:
         """Load YAML data"""
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
+                return yaml.load(file, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise DataValidationError(f"Invalid YAML in {file_path}: {e}")
         except Exception as e:
@@ -266,10 +272,11 @@ class DataManager:
             User data dictionary or None if not found
         """
         users = self.get_user_data(user_type)
-        for user in users:
-            if user.get("id") == user_id:
-                return user
-        return None
+        cached = self._user_index.get(user_type)
+        if cached is None or cached[0] is not users:
+            cached = (users, {user.get("id"): user for user in users})
+            self._user_index[user_type] = cached
+        return cached[1].get(user_id)
     
     def get_app_config(self, platform: str = None) -> Dict[str, Any]:
         """
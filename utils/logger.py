@@ -8,7 +8,7 @@ import logging
 import threading
 from datetime import datetime
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 
 from config.config_manager import config_manager
 
@@ -20,6 +20,10 @@ class LoggerManager:
     _lock = threading.Lock()
     _initialized = False
     
+    # Buffered loggers hold this many file records before writing them out
+    # (errors are written immediately)
+    _BUFFER_CAPACITY = 100
+    
     @classmethod
     def _initialize_logging(cls):
         """Initialize logging configuration."""
@@ -50,8 +54,17 @@ class LoggerManager:
             cls._initialized = True
     
     @classmethod
-    def get_logger(cls, name: str) -> logging.Logger:
-        """Get or create a logger instance."""
+    def get_logger(cls, name: str, buffered: bool = False) -> logging.Logger:
+        """
+        Get or create a logger instance.
+        
+        Args:
+            name: Logger name
+            buffered: Batch file output in memory until flushed, full or an error is logged
+            
+        Returns:
+            logging.Logger: Configured logger
+        """
         cls._initialize_logging()
         
         if name not in cls._loggers:
@@ -94,6 +107,12 @@ class LoggerManager:
                             datefmt='%Y-%m-%d %H:%M:%S'
                         )
                         file_handler.setFormatter(file_formatter)
+                        if buffered:
+                            file_handler = MemoryHandler(
+                                cls._BUFFER_CAPACITY,
+                                flushLevel=logging.ERROR,
+                                target=file_handler
+                            )
                         logger.addHandler(file_handler)
                     
                     # Prevent propagation to root logger
@@ -104,9 +123,9 @@ class LoggerManager:
         return cls._loggers[name]
 
 
-def get_logger(name: str) -> logging.Logger:
+def get_logger(name: str, buffered: bool = False) -> logging.Logger:
     """Convenience function to get a logger instance."""
-    return LoggerManager.get_logger(name)
+    return LoggerManager.get_logger(name, buffered)
 
 
 class TestLogger:
@@ -115,7 +134,7 @@ class TestLogger:
     def __init__(self, test_name: str):
         """Initialize test logger."""
         self.test_name = test_name
-        self.logger = get_logger(f"TEST.{test_name}")
+        self.logger = get_logger(f"TEST.{test_name}", buffered=True)
         self.start_time = datetime.now()
     
     def test_start(self, description: str = ""):
@@ -138,9 +157,9 @@ class TestLogger:
         self.logger.info(f"Duration: {duration}")
         self.logger.info("-" * 80)
     
-    def step(self, step_description: str):
-        """Log test step."""
-        self.logger.info(f"STEP: {step_description}")
+    def step(self, step_description: str, *args):
+        """Log test step; %-style args are only formatted if the record is emitted."""
+        self.logger.info("STEP: " + step_description, *args)
     
     def assertion(self, description: str, result: bool):
         """Log assertion result."""
@@ -167,6 +186,11 @@ class TestLogger:
     def debug(self, debug_message: str):
         """Log debug message."""
         self.logger.debug(f"DEBUG: {debug_message}")
+    
+    def flush(self):
+        """Write out any buffered log records."""
+        for handler in self.logger.handlers:
+            handler.flush()
 
 
 def create_test_logger(test_name: str) -> TestLogger:
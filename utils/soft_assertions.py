@@ -3,11 +3,22 @@ Soft Assertions Implementation for Mobile Automation Framework
 Allows tests to continue execution even after assertion failures.
 """
 
+import logging
 import traceback
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Union
 from utils.logger import get_logger
 
 
+# Assertion messages may be a string or a zero-argument callable returning one;
+# callables are only invoked when the text is actually needed
+Message = Union[str, Callable[[], str]]
+
+
+def _resolve(message: Message) -> str:
+    """Return the message text, calling it if it was passed lazily."""
+    return message() if callable(message) else message
+
+
 class AssertionError(Exception):
     """Custom assertion error for soft assertions."""
     pass
@@ -24,138 +35,141 @@ class SoftAssertions:
         self.passed_assertions = 0
         self.failed_assertions = 0
     
-    def assert_true(self, condition: bool, message: str = "") -> bool:
+    def assert_true(self, condition: bool, message: Message = "") -> bool:
         """Assert that condition is True."""
-        return self._assert(condition, message, f"Expected True, but got {condition}")
+        return self._assert(condition, message, lambda: f"Expected True, but got {condition}")
     
-    def assert_false(self, condition: bool, message: str = "") -> bool:
+    def assert_false(self, condition: bool, message: Message = "") -> bool:
         """Assert that condition is False."""
-        return self._assert(not condition, message, f"Expected False, but got {condition}")
+        return self._assert(not condition, message, lambda: f"Expected False, but got {condition}")
     
-    def assert_equal(self, actual: Any, expected: Any, message: str = "") -> bool:
+    def assert_equal(self, actual: Any, expected: Any, message: Message = "") -> bool:
         """Assert that actual equals expected."""
         condition = actual == expected
-        default_message = f"Expected '{expected}', but got '{actual}'"
+        default_message = lambda: f"Expected '{expected}', but got '{actual}'"
         return self._assert(condition, message, default_message)
     
-    def assert_not_equal(self, actual: Any, expected: Any, message: str = "") -> bool:
+    def assert_not_equal(self, actual: Any, expected: Any, message: Message = "") -> bool:
         """Assert that actual does not equal expected."""
         condition = actual != expected
-        default_message = f"Expected '{actual}' to not equal '{expected}'"
+        default_message = lambda: f"Expected '{actual}' to not equal '{expected}'"
         return self._assert(condition, message, default_message)
     
-    def assert_greater(self, actual: Any, expected: Any, message: str = "") -> bool:
+    def assert_greater(self, actual: Any, expected: Any, message: Message = "") -> bool:
         """Assert that actual is greater than expected."""
         condition = actual > expected
-        default_message = f"Expected '{actual}' to be greater than '{expected}'"
+        default_message = lambda: f"Expected '{actual}' to be greater than '{expected}'"
         return self._assert(condition, message, default_message)
     
-    def assert_greater_equal(self, actual: Any, expected: Any, message: str = "") -> bool:
+    def assert_greater_equal(self, actual: Any, expected: Any, message: Message = "") -> bool:
         """Assert that actual is greater than or equal to expected."""
         condition = actual >= expected
-        default_message = f"Expected '{actual}' to be greater than or equal to '{expected}'"
+        default_message = lambda: f"Expected '{actual}' to be greater than or equal to '{expected}'"
         return self._assert(condition, message, default_message)
     
-    def assert_less(self, actual: Any, expected: Any, message: str = "") -> bool:
+    def assert_less(self, actual: Any, expected: Any, message: Message = "") -> bool:
         """Assert that actual is less than expected."""
         condition = actual < expected
-        default_message = f"Expected '{actual}' to be less than '{expected}'"
+        default_message = lambda: f"Expected '{actual}' to be less than '{expected}'"
         return self._assert(condition, message, default_message)
     
-    def assert_less_equal(self, actual: Any, expected: Any, message: str = "") -> bool:
+    def assert_less_equal(self, actual: Any, expected: Any, message: Message = "") -> bool:
         """Assert that actual is less than or equal to expected."""
         condition = actual <= expected
-        default_message = f"Expected '{actual}' to be less than or equal to '{expected}'"
+        default_message = lambda: f"Expected '{actual}' to be less than or equal to '{expected}'"
         return self._assert(condition, message, default_message)
     
-    def assert_in(self, item: Any, container: Any, message: str = "") -> bool:
+    def assert_in(self, item: Any, container: Any, message: Message = "") -> bool:
         """Assert that item is in container."""
         condition = item in container
-        default_message = f"Expected '{item}' to be in '{container}'"
+        default_message = lambda: f"Expected '{item}' to be in '{container}'"
         return self._assert(condition, message, default_message)
     
-    def assert_not_in(self, item: Any, container: Any, message: str = "") -> bool:
+    def assert_not_in(self, item: Any, container: Any, message: Message = "") -> bool:
         """Assert that item is not in container."""
         condition = item not in container
-        default_message = f"Expected '{item}' to not be in '{container}'"
+        default_message = lambda: f"Expected '{item}' to not be in '{container}'"
         return self._assert(condition, message, default_message)
     
-    def assert_is_none(self, value: Any, message: str = "") -> bool:
+    def assert_is_none(self, value: Any, message: Message = "") -> bool:
         """Assert that value is None."""
         condition = value is None
-        default_message = f"Expected None, but got '{value}'"
+        default_message = lambda: f"Expected None, but got '{value}'"
         return self._assert(condition, message, default_message)
     
-    def assert_is_not_none(self, value: Any, message: str = "") -> bool:
+    def assert_is_not_none(self, value: Any, message: Message = "") -> bool:
         """Assert that value is not None."""
         condition = value is not None
-        default_message = f"Expected value to not be None"
+        default_message = lambda: f"Expected value to not be None"
         return self._assert(condition, message, default_message)
     
-    def assert_contains(self, text: str, substring: str, message: str = "") -> bool:
+    def assert_contains(self, text: str, substring: str, message: Message = "") -> bool:
         """Assert that text contains substring."""
         condition = substring in text
-        default_message = f"Expected '{text}' to contain '{substring}'"
+        default_message = lambda: f"Expected '{text}' to contain '{substring}'"
         return self._assert(condition, message, default_message)
     
-    def assert_not_contains(self, text: str, substring: str, message: str = "") -> bool:
+    def assert_not_contains(self, text: str, substring: str, message: Message = "") -> bool:
         """Assert that text does not contain substring."""
         condition = substring not in text
-        default_message = f"Expected '{text}' to not contain '{substring}'"
+        default_message = lambda: f"Expected '{text}' to not contain '{substring}'"
         return self._assert(condition, message, default_message)
     
-    def assert_starts_with(self, text: str, prefix: str, message: str = "") -> bool:
+    def assert_starts_with(self, text: str, prefix: str, message: Message = "") -> bool:
         """Assert that text starts with prefix."""
         condition = text.startswith(prefix)
-        default_message = f"Expected '{text}' to start with '{prefix}'"
+        default_message = lambda: f"Expected '{text}' to start with '{prefix}'"
         return self._assert(condition, message, default_message)
     
-    def assert_ends_with(self, text: str, suffix: str, message: str = "") -> bool:
+    def assert_ends_with(self, text: str, suffix: str, message: Message = "") -> bool:
         """Assert that text ends with suffix."""
         condition = text.endswith(suffix)
-        default_message = f"Expected '{text}' to end with '{suffix}'"
+        default_message = lambda: f"Expected '{text}' to end with '{suffix}'"
         return self._assert(condition, message, default_message)
     
-    def assert_regex_match(self, text: str, pattern: str, message: str = "") -> bool:
+    def assert_regex_match(self, text: str, pattern: str, message: Message = "") -> bool:
         """Assert that text matches regex pattern."""
         import re
         condition = bool(re.search(pattern, text))
-        default_message = f"Expected '{text}' to match pattern '{pattern}'"
+        default_message = lambda: f"Expected '{text}' to match pattern '{pattern}'"
         return self._assert(condition, message, default_message)
     
-    def assert_length(self, container: Any, expected_length: int, message: str = "") -> bool:
+    def assert_length(self, container: Any, expected_length: int, message: Message = "") -> bool:
         """Assert that container has expected length."""
         actual_length = len(container)
         condition = actual_length == expected_length
-        default_message = f"Expected length {expected_length}, but got {actual_length}"
+        default_message = lambda: f"Expected length {expected_length}, but got {actual_length}"
         return self._assert(condition, message, default_message)
     
-    def assert_empty(self, container: Any, message: str = "") -> bool:
+    def assert_empty(self, container: Any, message: Message = "") -> bool:
         """Assert that container is empty."""
         condition = len(container) == 0
-        default_message = f"Expected empty container, but got length {len(container)}"
+        default_message = lambda: f"Expected empty container, but got length {len(container)}"
         return self._assert(condition, message, default_message)
     
-    def assert_not_empty(self, container: Any, message: str = "") -> bool:
+    def assert_not_empty(self, container: Any, message: Message = "") -> bool:
         """Assert that container is not empty."""
         condition = len(container) > 0
-        default_message = f"Expected non-empty container, but got empty container"
+        default_message = lambda: f"Expected non-empty container, but got empty container"
         return self._assert(condition, message, default_message)
     
-    def custom_assert(self, condition: bool, message: str) -> bool:
+    def custom_assert(self, condition: bool, message: Message) -> bool:
         """Custom assertion with user-defined condition and message."""
         return self._assert(condition, message, message)
     
-    def _assert(self, condition: bool, user_message: str, default_message: str) -> bool:
+    def _assert(self, condition: bool, user_message: Message, default_message: Message) -> bool:
         """Internal assertion method."""
-        assertion_message = user_message if user_message else default_message
+        message = user_message or default_message
         
         if condition:
             self.passed_assertions += 1
-            self.logger.debug(f"PASS: {assertion_message}")
+            # Passing assertions only need their text when debug logging is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"PASS: {_resolve(message)}")
             return True
         else:
             self.failed_assertions += 1
+            assertion_message = _resolve(message)
             
             # Capture stack trace
             stack_trace = traceback.format_stack()
@@ -166,10 +180,25 @@ class SoftAssertions:
                 'test_name': self.test_name
             }
             
+            # Failures are reported together by assert_all at the end of the test
             self.failures.append(failure_info)
-            self.logger.error(f"FAIL: {assertion_message}")
             return False
     
+    def record_failure(self, name: str, error: BaseException) -> None:
+        """
+        Record a failed step from a caught exception.
+        
+        Args:
+            name: Short identifier of the step that failed
+            error: Exception raised by the step
+        """
+        self.failed_assertions += 1
+        self.failures.append({
+            'message': f"{name}: {error}",
+            'stack_trace': ''.join(traceback.format_tb(error.__traceback__)),
+            'test_name': self.test_name
+        })
+    
     def has_failures(self) -> bool:
         """Check if there are any assertion failures."""
         return len(self.failures) > 0